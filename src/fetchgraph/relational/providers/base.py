@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import re
+from itertools import islice
 from typing import Any, List, Optional
 
 from ...core.models import ProviderInfo
@@ -20,6 +21,11 @@ from ..models import (
 )
 from ..types import SelectorsDict
 
+# Row cap and pre-bound formatters for the LLM-facing ``serialize`` output.
+_SERIALIZE_MAX_ROWS = 10
+_fmt_pair = "{}={}".format
+_fmt_related_pair = "{}:{}".format
+
 
 class RelationalDataProvider(ContextProvider, SupportsDescribe):
     """Base relational data provider operating on structured selectors.
@@ -100,16 +106,19 @@ class RelationalDataProvider(ContextProvider, SupportsDescribe):
             return "Semantic matches: " + "; ".join(parts)
         if isinstance(obj, QueryResult):
             lines: List[str] = []
-            for row in obj.rows[:10]:
-                parts = [f"{k}={v}" for k, v in row.data.items()]
+            for row in islice(obj.rows, _SERIALIZE_MAX_ROWS):
+                parts = list(map(_fmt_pair, row.data.keys(), row.data.values()))
                 for rk, rv in row.related.items():
-                    parts.append(f"{rk}=" + ",".join(f"{k}:{v}" for k, v in rv.items()))
+                    parts.append(
+                        f"{rk}=" + ",".join(map(_fmt_related_pair, rv.keys(), rv.values()))
+                    )
                 lines.append(" | ".join(parts))
             if obj.aggregations:
                 agg_parts = [f"{k}={v.value}" for k, v in obj.aggregations.items()]
                 lines.append("Aggregations: " + ", ".join(agg_parts))
-            if len(obj.rows) > 10:
-                lines.append(f"... trimmed {len(obj.rows) - 10} rows ...")
+            trimmed = len(obj.rows) - _SERIALIZE_MAX_ROWS
+            if trimmed > 0:
+                lines.append(f"... trimmed {trimmed} rows ...")
             return "\n".join(lines) or "(empty result)"
         return str(obj)
 
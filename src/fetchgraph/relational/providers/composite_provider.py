@@ -2,7 +2,22 @@ from __future__ import annotations
 
 """Composite relational provider that delegates to child providers."""
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+import itertools
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ..models import (
     AggregationResult,
@@ -16,12 +31,141 @@ from ..models import (
     RelationalQuery,
     RelationDescriptor,
     RowResult,
+    SelectExpr,
     SemanticOnlyRequest,
     SemanticOnlyResult,
 )
 from ..types import SelectorsDict
 from .base import RelationalDataProvider
 
+# Shared read-only fallback for rows lacking a related entity.
+_EMPTY_RELATED: Dict[str, Any] = {}
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _expect_query_result(result: Any, source: str) -> QueryResult:
+    """Return ``result`` if it is a :class:`QueryResult`, else raise ``TypeError``."""
+    # Exact-type check first: children return plain QueryResult instances, and
+    # this skips the ABC instance hook of pydantic's metaclass.
+    if type(result) is QueryResult or isinstance(result, QueryResult):
+        return result
+    raise TypeError(f"Expected QueryResult from {source}")
+
+
+def _bucket_rows_by_key(
+    rows: List[RowResult],
+    key: Callable[[RowResult], Any],
+    out: Dict[Any, List[RowResult]],
+) -> None:
+    """Append ``rows`` to ``out`` grouped by ``key``, preserving row order.
+
+    Remote rows for the same key usually arrive adjacent, so runs are grouped
+    with :func:`itertools.groupby` and each run costs a single dict probe.
+    Unsorted input is still grouped correctly, just with more runs.
+    """
+    for value, run in itertools.groupby(rows, key=key):
+        bucket = out.get(value)
+        if bucket is None:
+            out[value] = list(run)
+        else:
+            bucket.extend(run)
+
+
+_REVERSED_CARDINALITY = {
+    "1_to_1": "1_to_1",
+    "1_to_many": "many_to_1",
+    "many_to_1": "1_to_many",
+    "many_to_many": "many_to_many",
+}
+
+
+# Cross-provider aggregation merges: fold the non-null values of one bucket
+# into the running per-group state under ``alias``.
+def _merge_count(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    if values:
+        state[alias] = state.get(alias, 0) + len(values)
+
+
+def _merge_count_distinct(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    state.setdefault(alias, set()).update(values)
+
+
+def _merge_sum(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    if values:
+        state[alias] = sum(values, state.get(alias, 0))
+
+
+def _merge_min(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    if values:
+        low = min(values)
+        state[alias] = low if alias not in state else min(state[alias], low)
+
+
+def _merge_max(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    if values:
+        high = max(values)
+        state[alias] = high if alias not in state else max(state[alias], high)
+
+
+def _merge_avg(state: Dict[str, Any], alias: str, values: List[Any]) -> None:
+    if values:
+        total, count = state.get(alias, (0, 0))
+        state[alias] = (sum(values, total), count + len(values))
+
+
+def _finalize_avg(state: Dict[str, Any], alias: str) -> Any:
+    total, count = state.get(alias, (0, 0))
+    return total / count if count else None
+
+
+_AggMerge = Callable[[Dict[str, Any], str, List[Any]], None]
+_ResolvedAgg = Tuple[_AggMerge, str, Callable[[RowResult], Any]]
+
+_AGG_MERGERS: Dict[str, _AggMerge] = {
+    "count": _merge_count,
+    "count_distinct": _merge_count_distinct,
+    "sum": _merge_sum,
+    "min": _merge_min,
+    "max": _merge_max,
+    "avg": _merge_avg,
+}
+
+_AGG_FINALIZERS: Dict[str, Callable[[Dict[str, Any], str], Any]] = {
+    "count": lambda state, alias: state.get(alias, 0),
+    "count_distinct": lambda state, alias: len(state.get(alias, ())),
+    "sum": lambda state, alias: state.get(alias, 0),
+    "min": lambda state, alias: state.get(alias),
+    "max": lambda state, alias: state.get(alias),
+    "avg": _finalize_avg,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _RelationPlan:
+    """Plain-string view of a relation descriptor used on the join hot path."""
+
+    name: str
+    from_entity: str
+    to_entity: str
+    from_col: str
+    to_col: str
+    cardinality: str
+    join_type: str
+
+    @classmethod
+    def from_descriptor(cls, rel: RelationDescriptor) -> "_RelationPlan":
+        return cls(
+            name=rel.name,
+            from_entity=rel.join.from_entity,
+            to_entity=rel.join.to_entity,
+            from_col=rel.join.from_column,
+            to_col=rel.join.to_column,
+            cardinality=rel.cardinality,
+            join_type=rel.join.join_type,
+        )
+
 
 class CompositeRelationalProvider(RelationalDataProvider):
     """Composite provider delegating to child relational providers."""
@@ -33,6 +177,10 @@ class CompositeRelationalProvider(RelationalDataProvider):
         max_join_rows_per_batch: int = 1000,
         max_right_rows_per_batch: int = 5000,
         max_join_bytes: Optional[int] = None,
+        right_coalesce_batches: int = 1,
+        max_remote_workers: int = 1,
+        copy_on_emit: bool = False,
+        prefetch_local_batches: bool = False,
     ):
         def _norm_entity(e: EntityDescriptor) -> Dict[str, Any]:
             d = e.model_dump()
@@ -85,8 +233,42 @@ class CompositeRelationalProvider(RelationalDataProvider):
         self.max_right_rows_per_batch = max_right_rows_per_batch
         self.max_join_bytes = max_join_bytes
         # TODO: enforce max_join_bytes when estimating join materialization size
+        if right_coalesce_batches < 1:
+            raise ValueError("right_coalesce_batches must be >= 1")
+        # Number of left batches whose join keys are fetched from the remote
+        # side together. Higher values amortize remote round-trips at the cost
+        # of holding more left rows in memory.
+        self.right_coalesce_batches = right_coalesce_batches
+        if max_remote_workers < 1:
+            raise ValueError("max_remote_workers must be >= 1")
+        # Remote key chunks are fetched concurrently only when explicitly
+        # enabled: child providers (e.g. sqlite connections) are not
+        # necessarily safe to call from several threads.
+        self.max_remote_workers = max_remote_workers
+        # When False, joined rows share the left row's data/related payloads
+        # instead of copying them per match; enable if callers mutate rows.
+        self.copy_on_emit = copy_on_emit
+        self._remote_pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(
+                max_workers=max_remote_workers, thread_name_prefix=f"{name}-remote"
+            )
+            if max_remote_workers > 1
+            else None
+        )
+        # When enabled, the next root-provider page is fetched on a dedicated
+        # thread while the current page is joined with the remote side. Off by
+        # default for the same thread-safety reasons as max_remote_workers.
+        self.prefetch_local_batches = prefetch_local_batches
+        self._local_pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{name}-local")
+            if prefetch_local_batches
+            else None
+        )
+
+        self._entity_names = frozenset(entity_by_name)
 
-        # NOTE: entities may be exposed by multiple children.
+        # NOTE: entities may be exposed by multiple children. Each child's
+        # ``_entity_index`` is snapshotted here; routing never re-reads it.
         self._entity_to_providers: Dict[str, Set[str]] = {}
         self._provider_entities: Dict[str, Set[str]] = {}
         self._provider_relations: Dict[str, Set[str]] = {}
@@ -108,63 +290,231 @@ class CompositeRelationalProvider(RelationalDataProvider):
                     "Composite routing requires relation names to be unique across children."
                 )
             self._relation_index[rel.name] = rel
+        self._relation_plans: Dict[str, _RelationPlan] = {
+            rel_name: _RelationPlan.from_descriptor(rel)
+            for rel_name, rel in self._relation_index.items()
+        }
+
+        # Routing depends only on the (static) child schemas and the entity /
+        # relation sets a query touches, so decisions (with the resolved child)
+        # are memoized per instance.
+        self._route_for = lru_cache(maxsize=512)(self._route_for_impl)
+        self._cross_plan_for = lru_cache(maxsize=256)(self._cross_plan_for_impl)
+        # Filter node handlers for _collect_entities_into, keyed by exact model class.
+        self._entity_collectors: Dict[type, Callable[..., None]] = {
+            ComparisonFilter: self._collect_comparison_entities,
+            LogicalFilter: self._collect_logical_entities,
+        }
 
     def fetch(self, feature_name: str, selectors: Optional[SelectorsDict] = None, **kwargs):
-        selectors = selectors or {}
-        op = selectors.get("op")
-        if op != "query":
+        """Route a query to a single child or execute it as a cross-provider join.
+
+        Selectors are validated once here. Children that keep the default
+        :meth:`RelationalDataProvider.fetch` receive the parsed query through
+        ``_handle_query``; children overriding ``fetch`` still get the raw selectors.
+        """
+        if not selectors or selectors.get("op") != "query":
             return super().fetch(feature_name, selectors, **kwargs)
         req = RelationalQuery.model_validate(selectors)
         child_choice = self._choose_child(req)
         if child_choice is None:
             return self._execute_cross_provider_query(req, feature_name, **kwargs)
         child_name, target = child_choice
-        result = target.fetch(feature_name, selectors, **kwargs)
+        if getattr(target.fetch, "__func__", None) is RelationalDataProvider.fetch:
+            # The child uses the stock ``fetch`` entrypoint, which would only
+            # re-validate the same selectors; hand it the parsed query instead.
+            result = target._handle_query(req)
+        else:
+            result = target.fetch(feature_name, selectors, **kwargs)
         if isinstance(result, QueryResult):
             result.meta.setdefault("provider", target.name)
             result.meta.setdefault("child_provider", child_name)
         return result
 
+    def close(self) -> None:
+        """Shut down the remote worker and local prefetch pools, if any.
+
+        Child providers are not closed. Later queries still work, fetching
+        remote chunks and root-provider pages sequentially.
+        """
+        if self._remote_pool is not None:
+            self._remote_pool.shutdown(wait=True)
+            self._remote_pool = None
+        if self._local_pool is not None:
+            self._local_pool.shutdown(wait=True)
+            self._local_pool = None
+
     def _choose_child(
         self, req: RelationalQuery
     ) -> Optional[tuple[str, RelationalDataProvider]]:
         involved_entities = self._collect_involved_entities(req)
-        required_relations = set(req.relations)
-        for name, prov in self.children.items():
-            if not involved_entities.issubset(self._provider_entities.get(name, set())):
+        return self._route_for(frozenset(involved_entities), frozenset(req.relations))
+
+    def _route_for_impl(
+        self, involved_entities: frozenset[str], required_relations: frozenset[str]
+    ) -> Optional[tuple[str, RelationalDataProvider]]:
+        # Intersect the per-entity host sets instead of probing every child.
+        candidates: Optional[Set[str]] = None
+        for ent in involved_entities:
+            hosts = self._entity_to_providers.get(ent)
+            if not hosts:
+                return None
+            candidates = set(hosts) if candidates is None else candidates & hosts
+            if not candidates:
+                return None
+        for name in self.children:
+            if candidates is not None and name not in candidates:
                 continue
             if not required_relations.issubset(self._provider_relations.get(name, set())):
                 continue
-            return name, prov
+            return name, self.children[name]
         return None
 
-    def _plan_cross_provider(
-        self, req: RelationalQuery
-    ) -> Tuple[str, RelationalDataProvider, List[str], RelationDescriptor]:
+    def _plan_cross_provider(self, req: RelationalQuery) -> Tuple[
+        str,
+        RelationalDataProvider,
+        List[str],
+        RelationDescriptor,
+        Optional[FilterClause],
+        Optional[FilterClause],
+    ]:
+        """Plan a cross-provider join.
+
+        Returns the root provider, the relations it executes locally, the cross
+        relation, and ``req.filters`` split into the part evaluated by the root
+        provider and the part pushed down to the remote side.
+        """
+        for clause in req.semantic_clauses:
+            if clause.entity != req.root_entity:
+                raise NotImplementedError("Semantic clauses across providers are not supported")
+
+        if not req.relations:
+            raise NotImplementedError("Cross-provider join requires at least one relation")
+
+        root_provider_name, local_relation_names, cross_relation = self._cross_plan_for(
+            req.root_entity, tuple(req.relations)
+        )
+        local_relations = list(local_relation_names)
+
+        left_filter, right_filter = self._split_cross_filters(
+            req, local_relations, cross_relation
+        )
         filter_entities: Set[str] = set()
-        if req.filters:
-            filter_entities.update(
-                self._collect_entities_from_filter(req.filters, req.root_entity)
-            )
+        if left_filter is not None:
+            self._collect_entities_into(left_filter, req.root_entity, filter_entities)
         for ent in filter_entities:
             if ent != req.root_entity:
                 raise NotImplementedError(
                     "Filters on non-root providers are not supported for cross-provider joins"
                 )
-        for clause in req.semantic_clauses:
-            if clause.entity != req.root_entity:
-                raise NotImplementedError("Semantic clauses across providers are not supported")
 
-        if not req.relations:
-            raise NotImplementedError("Cross-provider join requires at least one relation")
+        if root_provider_name is None:
+            raise NotImplementedError(
+                "Cross-provider join planning failed: no child provider can execute the "
+                "root-side relations prior to the cross boundary."
+            )
 
+        root_provider = self.children[root_provider_name]
+        return (
+            root_provider_name,
+            root_provider,
+            local_relations,
+            cross_relation,
+            left_filter,
+            right_filter,
+        )
+
+    def _cross_plan_for_impl(
+        self, root_entity: str, relations: Tuple[str, ...]
+    ) -> Tuple[Optional[str], Tuple[str, ...], RelationDescriptor]:
+        """Resolve the query-independent part of a cross-provider plan.
+
+        Depends only on the root entity and the relation chain, so results are
+        memoized per instance; filter checks stay in :meth:`_plan_cross_provider`.
+        """
         # Current limitation: a single cross-provider boundary, and it must be the
         # last relation in the chain.
-        local_relations = list(req.relations[:-1])
-        cross_relation_name = req.relations[-1]
+        local_relations = relations[:-1]
+        cross_relation_name = relations[-1]
         cross_relation = self._relation_index.get(cross_relation_name)
         if not cross_relation:
             raise KeyError(f"Relation '{cross_relation_name}' not found")
+        # Root-side filters may only reference the root entity, which the
+        # chosen child exposes anyway.
+        root_provider_name = self._root_provider_for_impl(
+            root_entity, local_relations, frozenset({root_entity})
+        )
+        return root_provider_name, local_relations, cross_relation
+
+    def _split_cross_filters(
+        self,
+        req: RelationalQuery,
+        local_relations: List[str],
+        cross_relation: RelationDescriptor,
+    ) -> Tuple[Optional[FilterClause], Optional[FilterClause]]:
+        """Split top-level AND conjuncts into root-side and remote-side filters.
+
+        A conjunct referencing only the remote entity of ``cross_relation`` is
+        pushed down to the remote fetch; this is only equivalent to filtering
+        the joined rows for inner joins. Every other conjunct stays on the root
+        side.
+        """
+        if req.filters is None:
+            return None, None
+
+        local_entities = {req.root_entity}
+        for rel_name in local_relations:
+            rel = self._relation_index.get(rel_name)
+            if rel:
+                local_entities.update((rel.from_entity, rel.to_entity))
+        remote_entities = {cross_relation.from_entity, cross_relation.to_entity} - local_entities
+
+        conjuncts: List[FilterClause] = []
+        stack: List[FilterClause] = [req.filters]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, LogicalFilter) and node.op == "and":
+                stack.extend(reversed(node.clauses))
+            else:
+                conjuncts.append(node)
+
+        left: List[FilterClause] = []
+        right: List[FilterClause] = []
+        ents: Set[str] = set()
+        for conjunct in conjuncts:
+            ents.clear()
+            self._collect_entities_into(conjunct, req.root_entity, ents)
+            if remote_entities and ents <= remote_entities and len(ents) == 1:
+                right.append(conjunct)
+            else:
+                left.append(conjunct)
+
+        if right and cross_relation.join.join_type != "inner":
+            raise NotImplementedError(
+                "Filters on non-root providers are not supported for cross-provider "
+                f"'{cross_relation.join.join_type}' joins"
+            )
+
+        def combine(clauses: List[FilterClause]) -> Optional[FilterClause]:
+            if not clauses:
+                return None
+            if len(clauses) == 1:
+                return clauses[0]
+            return LogicalFilter(op="and", clauses=clauses)
+
+        return combine(left), combine(right)
+
+    def _root_provider_for_impl(
+        self,
+        root_entity: str,
+        local_relations: Tuple[str, ...],
+        filter_entities: frozenset[str],
+    ) -> Optional[str]:
+        """Pick the first child that can run the root side of a cross-provider join.
+
+        The child must expose the root entity, every entity referenced by
+        root-side filters, and both ends of each relation before the boundary.
+        """
 
         def provider_supports_relation(provider_name: str, rel_name: str) -> bool:
             if rel_name not in self._provider_relations.get(provider_name, set()):
@@ -175,32 +525,15 @@ class CompositeRelationalProvider(RelationalDataProvider):
             ents = self._provider_entities.get(provider_name, set())
             return rel.from_entity in ents and rel.to_entity in ents
 
-        # Choose a root provider that can execute all relations before the cross
-        # boundary and contains all entities referenced by root-side filters.
-        root_candidates: List[str] = []
         for provider_name in self.children.keys():
             ents = self._provider_entities.get(provider_name, set())
-            if req.root_entity not in ents:
+            if root_entity not in ents:
                 continue
-            if req.filters and not set(filter_entities).issubset(ents):
+            if not filter_entities.issubset(ents):
                 continue
-            ok = True
-            for rel_name in local_relations:
-                if not provider_supports_relation(provider_name, rel_name):
-                    ok = False
-                    break
-            if ok:
-                root_candidates.append(provider_name)
-
-        if not root_candidates:
-            raise NotImplementedError(
-                "Cross-provider join planning failed: no child provider can execute the "
-                "root-side relations prior to the cross boundary."
-            )
-
-        root_provider_name = root_candidates[0]
-        root_provider = self.children[root_provider_name]
-        return root_provider_name, root_provider, local_relations, cross_relation
+            if all(provider_supports_relation(provider_name, rel) for rel in local_relations):
+                return provider_name
+        return None
 
     # --- Cross-provider execution helpers ---
     def _execute_cross_provider_query(
@@ -211,7 +544,12 @@ class CompositeRelationalProvider(RelationalDataProvider):
             root_provider,
             local_relations,
             cross_relation,
+            left_filter,
+            right_filter,
         ) = self._plan_cross_provider(req)
+        if right_filter is not None:
+            # Only the root-side conjuncts are sent with the local batches.
+            req = req.model_copy(update={"filters": left_filter})
 
         if req.group_by or req.aggregations:
             return self._execute_cross_provider_aggregate(
@@ -221,71 +559,185 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 root_provider,
                 local_relations,
                 cross_relation,
+                right_filter=right_filter,
                 **kwargs,
             )
 
-        remaining = req.limit
-        offset = req.offset or 0
-        all_rows: List[RowResult] = []
-        while True:
-            if remaining is not None and remaining <= 0:
-                break
-            batch_limit = self.max_join_rows_per_batch
-            if remaining is not None:
-                batch_limit = min(batch_limit, remaining)
-            local_req = req.model_copy(
-                update={
-                    "relations": local_relations,
-                    "offset": offset,
-                    "limit": batch_limit,
-                    # Clear select to avoid pushing remote-field projections to
-                    # the root provider; selection can be applied after join if
-                    # needed.
-                    "select": [],
-                }
-            )
-            local_result = root_provider.fetch(
-                feature_name, selectors=local_req.model_dump(), **kwargs
-            )
-            if not isinstance(local_result, QueryResult):
-                raise TypeError("Expected QueryResult from child provider")
-            left_rows = local_result.rows
-            if len(left_rows) > self.max_join_rows_per_batch:
-                raise MemoryError("Left join batch exceeds maximum allowed rows")
-            if not left_rows:
-                break
-
-            joined_rows = self._join_batch_with_remote(
-                left_rows, req, cross_relation, root_provider_name, feature_name, **kwargs
-            )
-
-            batch_start_len = len(all_rows)
-            for row in joined_rows:
-                if remaining is not None and len(all_rows) >= remaining:
-                    break
-                all_rows.append(row)
-            if remaining is not None:
-                added = len(all_rows) - batch_start_len
-                remaining = remaining - added
-                if remaining <= 0:
-                    break
-            # NOTE: offset and limit are applied to the root-entity rows prior to
-            # join expansion. Joined-row offsets are not currently supported for
-            # cross-provider joins.
-            offset += len(left_rows)
-            if len(left_rows) < batch_limit:
-                break
-
         meta = {
             "composite": True,
             "root_provider": root_provider_name,
             "cross_relation": cross_relation.name,
             "relations_used": req.relations,
         }
+        # Rows are streamed batch by batch; only the requested window is
+        # materialized, and islice stops pulling left batches once it is full.
+        rows_iter = self._iter_cross_provider_rows(
+            req,
+            feature_name,
+            root_provider_name,
+            root_provider,
+            local_relations,
+            cross_relation,
+            right_filter=right_filter,
+            **kwargs,
+        )
+        all_rows = list(itertools.islice(rows_iter, req.limit))
         projected_rows = self._apply_select_to_rows(
             all_rows, req.select, req.root_entity
         )
-        return QueryResult(rows=projected_rows, meta=meta)
+        # Rows were built from validated child results; skip re-validation.
+        return QueryResult.model_construct(rows=projected_rows, meta=meta)
+
+    def _iter_cross_provider_rows(
+        self,
+        req: RelationalQuery,
+        feature_name: str,
+        root_provider_name: str,
+        root_provider: RelationalDataProvider,
+        local_relations: List[str],
+        cross_relation: RelationDescriptor,
+        right_filter: Optional[FilterClause] = None,
+        **kwargs,
+    ) -> Iterator[RowResult]:
+        """Yield joined rows lazily, one left batch at a time.
+
+        The generator keeps track of how many rows were yielded so that the
+        left-side batch size never exceeds the rows still needed by ``req.limit``.
+        Up to ``right_coalesce_batches`` left batches are buffered and joined
+        with a single set of remote fetches.
+        """
+        remaining = req.limit
+        offset = req.offset or 0
+        pending: List[RowResult] = []
+        pending_batches = 0
+        # Dump the query once; each batch only differs in offset/limit.
+        base_selectors = req.model_dump()
+        base_selectors["relations"] = list(local_relations)
+        # Clear select to avoid pushing remote-field projections to the root
+        # provider; selection can be applied after join if needed.
+        base_selectors["select"] = []
+        # Left joins over to-one relations emit exactly one row per left row,
+        # so the rows a batch contributes are known before it is joined.
+        row_preserving = remaining is not None and self._is_row_preserving_join(
+            req.root_entity, cross_relation, right_filter
+        )
+        remaining_after: Optional[int] = None
+        next_batch: Optional[Tuple[Future, int]] = None
+        try:
+            while True:
+                if remaining is not None and remaining <= 0:
+                    return
+                if next_batch is not None:
+                    future, batch_limit = next_batch
+                    next_batch = None
+                    left_rows = future.result()
+                else:
+                    # Buffered left rows of a row-preserving join already
+                    # account for that many output rows.
+                    batch_limit = self._left_batch_limit(
+                        remaining - len(pending)
+                        if row_preserving and remaining is not None
+                        else remaining
+                    )
+                    left_rows = self._fetch_left_batch(
+                        root_provider,
+                        feature_name,
+                        {**base_selectors, "offset": offset, "limit": batch_limit},
+                        **kwargs,
+                    )
+                # NOTE: offset and limit are applied to the root-entity rows prior to
+                # join expansion. Joined-row offsets are not currently supported for
+                # cross-provider joins.
+                offset += len(left_rows)
+                exhausted = len(left_rows) < batch_limit
+                if row_preserving and remaining is not None:
+                    remaining_after = remaining - len(pending) - len(left_rows)
+                    # The window is full once this batch is joined; stop
+                    # paging the root provider instead of probing for more.
+                    exhausted = exhausted or remaining_after <= 0
+                if not exhausted and self._local_pool is not None:
+                    # Sized by the rows still needed before this batch is joined;
+                    # any surplus is cut off by the remaining counter below.
+                    next_limit = self._left_batch_limit(
+                        remaining_after if row_preserving else remaining
+                    )
+                    next_batch = (
+                        self._local_pool.submit(
+                            self._fetch_left_batch,
+                            root_provider,
+                            feature_name,
+                            {**base_selectors, "offset": offset, "limit": next_limit},
+                            **kwargs,
+                        ),
+                        next_limit,
+                    )
+                if left_rows:
+                    pending.extend(left_rows)
+                    pending_batches += 1
+                if pending and (exhausted or pending_batches >= self.right_coalesce_batches):
+                    joined_rows = self._join_batch_with_remote(
+                        pending,
+                        req,
+                        cross_relation,
+                        root_provider_name,
+                        feature_name,
+                        right_filter=right_filter,
+                        **kwargs,
+                    )
+                    pending = []
+                    pending_batches = 0
+                    for row in joined_rows:
+                        if remaining is not None:
+                            if remaining <= 0:
+                                return
+                            remaining -= 1
+                        yield row
+                if exhausted:
+                    return
+        finally:
+            if next_batch is not None:
+                next_batch[0].cancel()
+
+    def _is_row_preserving_join(
+        self,
+        root_entity: str,
+        relation: RelationDescriptor,
+        right_filter: Optional[FilterClause],
+    ) -> bool:
+        plan = self._relation_plans.get(relation.name) or _RelationPlan.from_descriptor(
+            relation
+        )
+        if plan.join_type != "left" or right_filter is not None:
+            return False
+        if root_entity == plan.from_entity:
+            right_entity = plan.to_entity
+        elif root_entity == plan.to_entity:
+            right_entity = plan.from_entity
+        else:
+            return False
+        return self._effective_cardinality(relation, root_entity, right_entity) in {
+            "1_to_1",
+            "many_to_1",
+        }
+
+    def _left_batch_limit(self, remaining: Optional[int]) -> int:
+        if remaining is None:
+            return self.max_join_rows_per_batch
+        return min(self.max_join_rows_per_batch, remaining)
+
+    def _fetch_left_batch(
+        self,
+        root_provider: RelationalDataProvider,
+        feature_name: str,
+        selectors: SelectorsDict,
+        **kwargs,
+    ) -> List[RowResult]:
+        local_result = root_provider.fetch(feature_name, selectors=selectors, **kwargs)
+        local_result = _expect_query_result(local_result, "child provider")
+        left_rows = local_result.rows
+        if len(left_rows) > self.max_join_rows_per_batch:
+            raise MemoryError("Left join batch exceeds maximum allowed rows")
+        return left_rows
 
     def _join_batch_with_remote(
         self,
@@ -294,9 +746,18 @@ class CompositeRelationalProvider(RelationalDataProvider):
         cross_relation: RelationDescriptor,
         root_provider_name: str,
         feature_name: str,
+        right_filter: Optional[FilterClause] = None,
         **kwargs,
     ) -> List[RowResult]:
-        join_type = cross_relation.join.join_type
+        """Join a batch of left rows with rows fetched from the remote provider.
+
+        ``right_filter`` holds conjuncts pushed down from the query; it is ANDed
+        with the join-key predicate of every remote request.
+        """
+        plan = self._relation_plans.get(
+            cross_relation.name
+        ) or _RelationPlan.from_descriptor(cross_relation)
+        join_type = plan.join_type
         if join_type not in {"inner", "left"}:
             raise NotImplementedError(f"Join type '{join_type}' is not supported for cross-provider joins")
 
@@ -305,35 +766,37 @@ class CompositeRelationalProvider(RelationalDataProvider):
 
         # Determine join direction based on which entity is actually present on
         # the left side rows.
-        from_ent = cross_relation.join.from_entity
-        to_ent = cross_relation.join.to_entity
+        from_ent = plan.from_entity
+        to_ent = plan.to_entity
         has_from = any(_row_has_entity(r, from_ent) for r in left_rows)
         has_to = any(_row_has_entity(r, to_ent) for r in left_rows)
 
         if has_from:
             left_entity = from_ent
             right_entity = to_ent
-            left_col = cross_relation.join.from_column
-            right_col = cross_relation.join.to_column
+            left_col = plan.from_col
+            right_col = plan.to_col
         elif has_to:
             left_entity = to_ent
             right_entity = from_ent
-            left_col = cross_relation.join.to_column
-            right_col = cross_relation.join.from_column
+            left_col = plan.to_col
+            right_col = plan.from_col
         else:
             raise KeyError(
-                f"Neither '{from_ent}' nor '{to_ent}' is present in left rows for cross join '{cross_relation.name}'"
+                f"Neither '{from_ent}' nor '{to_ent}' is present in left rows for cross join '{plan.name}'"
             )
 
         effective_cardinality = self._effective_cardinality(
             cross_relation, left_entity, right_entity
         )
 
-        join_keys: List[Any] = []
-        for row in left_rows:
-            value = self._extract_value(row, left_entity, left_col)
-            join_keys.append(value)
-        unique_keys = list({k for k in join_keys if k is not None})
+        # Keep each row's key for ordered emission; dict.fromkeys dedupes the
+        # keys in first-seen order without a separate set pass.
+        left_key = self._make_extractor(left_entity, left_col, req.root_entity)
+        join_keys: List[Any] = [left_key(row) for row in left_rows]
+        key_index: Dict[Any, None] = dict.fromkeys(join_keys)
+        key_index.pop(None, None)
+        unique_keys = list(key_index)
 
         right_candidates = self._entity_to_providers.get(right_entity, set())
         if not right_candidates:
@@ -359,70 +822,98 @@ class CompositeRelationalProvider(RelationalDataProvider):
         right_provider = self.children[right_provider_name]
 
         right_results: Dict[Any, List[RowResult]] = {}
-        single_right: Dict[Any, RowResult] = {}
+        # 1_to_1 / many_to_1 matches, stored as one-element lists so both
+        # cardinality paths share the emission loop below.
+        single_right: Dict[Any, List[RowResult]] = {}
 
         def chunks(iterable: List[Any], size: int):
             for i in range(0, len(iterable), size):
-                yield iterable[i : i + size]
+                yield tuple(iterable[i : i + size])
+
+        # Remote rows are rooted at right_entity, so the key lives in row.data.
+        right_key = self._make_extractor(right_entity, right_col, right_entity)
+        right_select = self._needed_right_columns(
+            req, right_entity, right_col, plan.name
+        )
 
-        for key_chunk in chunks(unique_keys, self.max_right_rows_per_batch):
-            comparison = ComparisonFilter(entity=right_entity, field=right_col, op="in", value=key_chunk)
+        # Remote selectors only differ in the key list and limit, so the rest of
+        # the query (and the pushed-down filter) is dumped once per batch.
+        # Pushed-down conjuncts keep the caller's case sensitivity; unfiltered
+        # key lookups keep the providers' default matching.
+        case_sensitivity = right_filter is not None and req.case_sensitivity
+        remote_template = RelationalQuery.model_construct(
+            root_entity=right_entity,
+            relations=[],
+            select=right_select,
+            offset=0,
+            case_sensitivity=case_sensitivity,
+        ).model_dump()
+        right_filter_dump = right_filter.model_dump() if right_filter is not None else None
+
+        def remote_selectors(keys: Sequence[Any], limit: int) -> SelectorsDict:
+            # Always ``in``: providers may relax ``=`` on strings (the SQL
+            # provider adds a substring match), which must not leak into joins.
+            key_filter: Dict[str, Any] = {
+                "type": "comparison",
+                "entity": right_entity,
+                "field": right_col,
+                "op": "in",
+                "value": keys,
+            }
+            if right_filter_dump is not None:
+                key_filter = {
+                    "type": "logical",
+                    "op": "and",
+                    "clauses": [key_filter, right_filter_dump],
+                }
+            return {**remote_template, "filters": key_filter, "limit": limit}
 
+        single_valued = effective_cardinality in {"1_to_1", "many_to_1"}
+        # Each key matches at most one row for 1_to_1 / many_to_1 and chunks are
+        # already capped at max_right_rows_per_batch, so the chunk size is the
+        # limit there; other cardinalities request a full batch.
+        fast_limit = self.max_right_rows_per_batch
+
+        def fetch_chunk(key_chunk: Tuple[Any, ...]) -> Tuple[Tuple[Any, ...], Any]:
+            chunk_selectors = remote_selectors(
+                key_chunk, len(key_chunk) if single_valued else fast_limit
+            )
+            return key_chunk, right_provider.fetch(
+                feature_name, selectors=chunk_selectors, **kwargs
+            )
+
+        key_chunks = list(chunks(unique_keys, self.max_right_rows_per_batch))
+        # Chunk results are consumed in submission order, so merging and the
+        # cardinality checks below stay sequential and deterministic.
+        for key_chunk, chunk_result in self._map_remote(fetch_chunk, key_chunks):
             # --- 1) 1_to_1 / many_to_1: safe to fetch in one request (<= key_chunk)
-            if effective_cardinality in {"1_to_1", "many_to_1"}:
-                remote_req = RelationalQuery(
-                    root_entity=right_entity,
-                    filters=comparison,
-                    relations=[],
-                    select=[],
-                    limit=self._remote_limit_for_cardinality(
-                        effective_cardinality, len(key_chunk)
-                    ),
-                    offset=0,
-                )
-                remote_result = right_provider.fetch(
-                    feature_name, selectors=remote_req.model_dump(), **kwargs
-                )
-                if not isinstance(remote_result, QueryResult):
-                    raise TypeError("Expected QueryResult from right provider")
+            if single_valued:
+                remote_result = chunk_result
+                remote_result = _expect_query_result(remote_result, "right provider")
                 if len(remote_result.rows) > self.max_right_rows_per_batch:
                     raise MemoryError("Right join batch exceeds maximum allowed rows")
                 for row in remote_result.rows:
-                    key = self._extract_value(row, right_entity, right_col)
+                    key = right_key(row)
                     if key in single_right:
                         raise ValueError(
-                            f"Cardinality {effective_cardinality} violated for relation '{cross_relation.name}'"
+                            f"Cardinality {effective_cardinality} violated for relation '{plan.name}'"
                         )
-                    single_right[key] = row
+                    single_right[key] = [row]
                 if len(remote_result.rows) > len(key_chunk):
                     raise ValueError(
-                        f"Cardinality {effective_cardinality} violated for relation '{cross_relation.name}'"
+                        f"Cardinality {effective_cardinality} violated for relation '{plan.name}'"
                     )
                 continue
 
             # --- 2) 1_to_many / many_to_many: correctness-first, avoid silent truncation
-            fast_limit = self.max_right_rows_per_batch
-            fast_req = RelationalQuery(
-                root_entity=right_entity,
-                filters=comparison,
-                relations=[],
-                select=[],
-                limit=fast_limit,
-                offset=0,
-            )
-            fast_res = right_provider.fetch(
-                feature_name, selectors=fast_req.model_dump(), **kwargs
-            )
-            if not isinstance(fast_res, QueryResult):
-                raise TypeError("Expected QueryResult from right provider")
+            fast_res = chunk_result
+            fast_res = _expect_query_result(fast_res, "right provider")
             if len(fast_res.rows) > self.max_right_rows_per_batch:
                 raise MemoryError("Right join batch exceeds maximum allowed rows")
 
             # Fast path: if we didn't hit the cap, nothing can be truncated.
             if len(fast_res.rows) < fast_limit:
-                for row in fast_res.rows:
-                    key = self._extract_value(row, right_entity, right_col)
-                    right_results.setdefault(key, []).append(row)
+                _bucket_rows_by_key(fast_res.rows, right_key, right_results)
                 continue
 
             # Slow path: we hit the cap -> may be truncated (single-key overflow OR multi-key sum overflow).
@@ -432,6 +923,8 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 entity=right_entity,
                 key_field=right_col,
                 keys=key_chunk,
+                extra_filter=right_filter,
+                case_sensitivity=case_sensitivity,
                 **kwargs,
             )
             groups = self._pack_keys_by_row_budget(key_chunk, counts, self.max_right_rows_per_batch)
@@ -459,35 +952,24 @@ class CompositeRelationalProvider(RelationalDataProvider):
                         key_value=k,
                         expected_count=int(counts.get(k, 0) or 0),
                         pk_field=pk_field,
+                        extra_filter=right_filter,
+                        select=right_select,
+                        case_sensitivity=case_sensitivity,
                         **kwargs,
                     )
-                    for row in rows:
-                        key = self._extract_value(row, right_entity, right_col)
-                        right_results.setdefault(key, []).append(row)
+                    _bucket_rows_by_key(rows, right_key, right_results)
                     continue
 
                 # Group fetch where sum(expected) <= budget -> fetch exactly expected_sum rows.
-                grp_filter = ComparisonFilter(entity=right_entity, field=right_col, op="in", value=gkeys)
-                grp_req = RelationalQuery(
-                    root_entity=right_entity,
-                    filters=grp_filter,
-                    relations=[],
-                    select=[],
-                    limit=expected_sum,
-                    offset=0,
-                )
                 grp_res = right_provider.fetch(
-                    feature_name, selectors=grp_req.model_dump(), **kwargs
+                    feature_name, selectors=remote_selectors(gkeys, expected_sum), **kwargs
                 )
-                if not isinstance(grp_res, QueryResult):
-                    raise TypeError("Expected QueryResult from right provider (group fetch)")
+                grp_res = _expect_query_result(grp_res, "right provider (group fetch)")
                 if len(grp_res.rows) > self.max_right_rows_per_batch:
                     raise MemoryError("Right join batch exceeds maximum allowed rows")
 
                 tmp: Dict[Any, List[RowResult]] = {}
-                for row in grp_res.rows:
-                    key = self._extract_value(row, right_entity, right_col)
-                    tmp.setdefault(key, []).append(row)
+                _bucket_rows_by_key(grp_res.rows, right_key, tmp)
 
                 # Validate per-key completeness; fallback to per-key paging if mismatch.
                 bad_keys = [k for k in gkeys if len(tmp.get(k, [])) != int(counts.get(k, 0) or 0)]
@@ -500,6 +982,9 @@ class CompositeRelationalProvider(RelationalDataProvider):
                         key_value=k,
                         expected_count=int(counts.get(k, 0) or 0),
                         pk_field=pk_field,
+                        extra_filter=right_filter,
+                        select=right_select,
+                        case_sensitivity=case_sensitivity,
                         **kwargs,
                     )
 
@@ -508,37 +993,94 @@ class CompositeRelationalProvider(RelationalDataProvider):
                         continue
                     right_results.setdefault(k, []).extend(rows)
 
+        copy_on_emit = self.copy_on_emit
+        matches_by_key = (
+            single_right if effective_cardinality in {"1_to_1", "many_to_1"} else right_results
+        )
         joined: List[RowResult] = []
         for row, key in zip(left_rows, join_keys):
-            if effective_cardinality in {"1_to_1", "many_to_1"}:
-                match_list = [single_right[key]] if key in single_right else []
-            else:
-                match_list = right_results.get(key, [])
-            matches = match_list
+            matches = matches_by_key.get(key)
             if not matches:
                 if join_type == "inner":
                     continue
                 joined.append(row)
                 continue
+            label = right_entity
+            if label in row.related:
+                # Avoid overwriting when the same entity is already present
+                # in related (e.g. repeated joins). Prefer the relation name.
+                label = plan.name or label
+                if label in row.related:
+                    label = f"{right_entity}__remote"
             for match in matches:
-                related = {k: dict(v) for k, v in row.related.items()}
-                label = right_entity
-                if label in related:
-                    # Avoid overwriting when the same entity is already present
-                    # in related (e.g. repeated joins). Prefer the relation name.
-                    label = cross_relation.name or label
-                    if label in related:
-                        label = f"{right_entity}__remote"
+                if copy_on_emit:
+                    related = {k: dict(v) for k, v in row.related.items()}
+                    data = dict(row.data)
+                else:
+                    # Output rows of the same left row share its data and
+                    # related payloads; only the outer related dict is new.
+                    related = dict(row.related)
+                    data = row.data
                 related[label] = match.data
+                # entity/data/related are forwarded from RowResults the child
+                # providers already validated, so skip re-validation per row.
                 joined.append(
-                    RowResult(
+                    RowResult.model_construct(
                         entity=row.entity,
-                        data=dict(row.data),
+                        data=data,
                         related=related,
                     )
                 )
         return joined
 
+    def _map_remote(
+        self, fn: Callable[[_T], _R], items: Sequence[_T]
+    ) -> Iterator[_R]:
+        """Apply ``fn`` to ``items``, concurrently when a remote pool is configured.
+
+        Results are yielded in the order of ``items`` either way.
+        """
+        if self._remote_pool is None or len(items) < 2:
+            return map(fn, items)
+        return self._remote_pool.map(fn, items)
+
+    def _needed_right_columns(
+        self,
+        req: RelationalQuery,
+        right_entity: str,
+        right_col: str,
+        relation_name: str,
+    ) -> List[SelectExpr]:
+        """Return the remote columns a cross-provider join has to fetch.
+
+        An empty list means "all columns": a row query without ``select`` returns
+        every related field. Otherwise only fields referenced through the remote
+        entity (or the labels it may be stored under) are requested, plus the
+        join key and primary key needed by the join itself.
+        """
+        is_aggregate = bool(req.group_by or req.aggregations)
+        if not is_aggregate and not req.select:
+            return []
+
+        labels = {right_entity, relation_name, f"{right_entity}__remote"}
+        refs: List[str] = []
+        if is_aggregate:
+            for grp in req.group_by:
+                refs.append(f"{grp.entity}.{grp.field}" if grp.entity else grp.field)
+            refs.extend(spec.field for spec in req.aggregations)
+        else:
+            refs.extend(expr.expr for expr in req.select)
+
+        needed: Dict[str, None] = {right_col: None}
+        pk_field = self._primary_key_field(right_entity)
+        if pk_field is not None:
+            needed[pk_field] = None
+        for ref in refs:
+            ent, sep, fld = ref.partition(".")
+            if sep and ent in labels:
+                needed[fld] = None
+        return [SelectExpr.model_construct(expr=fld, alias=None) for fld in needed]
+
     def _primary_key_field(self, entity: str) -> Optional[str]:
         """Return primary key field name for entity if declared in schema (role=='primary_key')."""
         for e in self.entities:
@@ -556,13 +1098,17 @@ class CompositeRelationalProvider(RelationalDataProvider):
         feature_name: str,
         entity: str,
         key_field: str,
-        keys: List[Any],
+        keys: Sequence[Any],
+        extra_filter: Optional[FilterClause] = None,
+        case_sensitivity: bool = False,
         **kwargs,
     ) -> Dict[Any, int]:
         """Return COUNT(*) per key_field for the given keys."""
         if not keys:
             return {}
-        base = ComparisonFilter(entity=entity, field=key_field, op="in", value=keys)
+        base: FilterClause = ComparisonFilter(entity=entity, field=key_field, op="in", value=keys)
+        if extra_filter is not None:
+            base = LogicalFilter(op="and", clauses=[base, extra_filter])
         count_req = RelationalQuery(
             root_entity=entity,
             filters=base,
@@ -573,10 +1119,10 @@ class CompositeRelationalProvider(RelationalDataProvider):
             # group_by output is bounded by len(keys), so no need to cap
             limit=None,
             offset=0,
+            case_sensitivity=case_sensitivity,
         )
         res = provider.fetch(feature_name, selectors=count_req.model_dump(), **kwargs)
-        if not isinstance(res, QueryResult):
-            raise TypeError("Expected QueryResult from right provider (count query)")
+        res = _expect_query_result(res, "right provider (count query)")
         counts: Dict[Any, int] = {k: 0 for k in keys}
         for row in res.rows:
             k = row.data.get(key_field)
@@ -589,7 +1135,7 @@ class CompositeRelationalProvider(RelationalDataProvider):
         return counts
 
     def _pack_keys_by_row_budget(
-        self, keys: List[Any], counts: Dict[Any, int], budget: int
+        self, keys: Sequence[Any], counts: Dict[Any, int], budget: int
     ) -> List[List[Any]]:
         """
         Greedy pack keys into groups where sum(counts[key]) <= budget.
@@ -630,20 +1176,30 @@ class CompositeRelationalProvider(RelationalDataProvider):
         key_value: Any,
         expected_count: int,
         pk_field: str,
+        extra_filter: Optional[FilterClause] = None,
+        select: Optional[List[SelectExpr]] = None,
+        case_sensitivity: bool = False,
         **kwargs,
     ) -> List[RowResult]:
         """
         Fetch exactly expected_count rows for entity where key_field == key_value.
         Uses paging and validates completeness; never silently truncates.
+        ``extra_filter`` is ANDed with the key predicate and ``select`` limits
+        the fetched columns when given; ``case_sensitivity`` is forwarded to
+        every page request.
         """
         if expected_count <= 0:
             return []
         page_limit = self.max_right_rows_per_batch
+        row_pk = self._make_extractor(entity, pk_field, entity)
         seen: Set[Any] = set()
         out: List[RowResult] = []
 
-        def _base_filter() -> ComparisonFilter:
-            return ComparisonFilter(entity=entity, field=key_field, op="=", value=key_value)
+        def _base_filter() -> FilterClause:
+            key_filter = ComparisonFilter(entity=entity, field=key_field, op="=", value=key_value)
+            if extra_filter is None:
+                return key_filter
+            return LogicalFilter(op="and", clauses=[key_filter, extra_filter])
 
         # 1) try offset paging first (fast path)
         offset = 0
@@ -655,18 +1211,18 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 root_entity=entity,
                 filters=_base_filter(),
                 relations=[],
-                select=[],
+                select=select or [],
                 limit=page_limit,
                 offset=offset,
+                case_sensitivity=case_sensitivity,
             )
             res = provider.fetch(feature_name, selectors=req.model_dump(), **kwargs)
-            if not isinstance(res, QueryResult):
-                raise TypeError("Expected QueryResult from right provider (paged fetch)")
+            res = _expect_query_result(res, "right provider (paged fetch)")
             if not res.rows:
                 break
             new = 0
             for row in res.rows:
-                pk = self._extract_value(row, entity, pk_field)
+                pk = row_pk(row)
                 if pk in seen:
                     continue
                 seen.add(pk)
@@ -713,17 +1269,17 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 root_entity=entity,
                 filters=_exclude_filter(),
                 relations=[],
-                select=[],
+                select=select or [],
                 limit=page_limit,
                 offset=0,
+                case_sensitivity=case_sensitivity,
             )
             res = provider.fetch(feature_name, selectors=req.model_dump(), **kwargs)
-            if not isinstance(res, QueryResult):
-                raise TypeError("Expected QueryResult from right provider (exclude fetch)")
+            res = _expect_query_result(res, "right provider (exclude fetch)")
             if not res.rows:
                 break
             for row in res.rows:
-                pk = self._extract_value(row, entity, pk_field)
+                pk = row_pk(row)
                 if pk in seen:
                     continue
                 seen.add(pk)
@@ -745,6 +1301,7 @@ class CompositeRelationalProvider(RelationalDataProvider):
         root_provider: RelationalDataProvider,
         local_relations: List[str],
         cross_relation: RelationDescriptor,
+        right_filter: Optional[FilterClause] = None,
         **kwargs,
     ) -> QueryResult:
         if req.group_by:
@@ -760,54 +1317,68 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 )
 
         default_count = bool(req.group_by and not req.aggregations)
+        # Field resolution is constant for the query; compile it once.
+        group_key = self._make_group_key(req.group_by, req.root_entity)
+        resolved_aggs = self._resolve_aggregations(req.aggregations, req.root_entity)
         if req.group_by:
             group_state: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
         else:
             group_state = {(): {}}
 
-        def ensure_state(key: Tuple[Any, ...]):
-            if key not in group_state:
-                group_state[key] = {}
-            return group_state[key]
-
         root_offset = 0
-        while True:
-            batch_limit = self.max_join_rows_per_batch
-            local_req = req.model_copy(
-                update={
-                    "relations": local_relations,
-                    "offset": root_offset,
-                    "limit": batch_limit,
-                    "group_by": [],
-                    "aggregations": [],
-                    "select": [],
-                }
-            )
-            local_result = root_provider.fetch(
-                feature_name, selectors=local_req.model_dump(), **kwargs
-            )
-            if not isinstance(local_result, QueryResult):
-                raise TypeError("Expected QueryResult from child provider")
-            left_rows = local_result.rows
-            if len(left_rows) > self.max_join_rows_per_batch:
-                raise MemoryError("Left join batch exceeds maximum allowed rows")
-            if not left_rows:
-                break
-
-            joined_rows = self._join_batch_with_remote(
-                left_rows, req, cross_relation, root_provider_name, feature_name, **kwargs
-            )
-
-            for row in joined_rows:
-                group_key = self._extract_group_key(row, req.group_by, req.root_entity)
-                state = ensure_state(group_key)
-                if default_count:
-                    state["count"] = state.get("count", 0) + 1
-                self._update_aggregations(state, row, req.aggregations, req.root_entity)
-
-            root_offset += len(left_rows)
-            if len(left_rows) < batch_limit:
-                break
+        pending: List[RowResult] = []
+        pending_batches = 0
+        base_selectors = req.model_dump()
+        base_selectors.update(
+            relations=list(local_relations), group_by=[], aggregations=[], select=[]
+        )
+        next_batch: Optional[Future] = None
+        batch_limit = self.max_join_rows_per_batch
+        try:
+            while True:
+                if next_batch is not None:
+                    left_rows = next_batch.result()
+                    next_batch = None
+                else:
+                    left_rows = self._fetch_left_batch(
+                        root_provider,
+                        feature_name,
+                        {**base_selectors, "offset": root_offset, "limit": batch_limit},
+                        **kwargs,
+                    )
+                root_offset += len(left_rows)
+                exhausted = len(left_rows) < batch_limit
+                if not exhausted and self._local_pool is not None:
+                    next_batch = self._local_pool.submit(
+                        self._fetch_left_batch,
+                        root_provider,
+                        feature_name,
+                        {**base_selectors, "offset": root_offset, "limit": batch_limit},
+                        **kwargs,
+                    )
+                if left_rows:
+                    pending.extend(left_rows)
+                    pending_batches += 1
+                if pending and (exhausted or pending_batches >= self.right_coalesce_batches):
+                    joined_rows = self._join_batch_with_remote(
+                        pending,
+                        req,
+                        cross_relation,
+                        root_provider_name,
+                        feature_name,
+                        right_filter=right_filter,
+                        **kwargs,
+                    )
+                    pending = []
+                    pending_batches = 0
+                    self._aggregate_rows(
+                        group_state, joined_rows, group_key, resolved_aggs, default_count
+                    )
+                if exhausted:
+                    break
+        finally:
+            if next_batch is not None:
+                next_batch.cancel()
 
         meta = {
             "composite": True,
@@ -829,13 +1400,15 @@ class CompositeRelationalProvider(RelationalDataProvider):
                 if default_count:
                     data["count"] = state.get("count", 0)
                 data.update(self._finalize_aggregations(state, req.aggregations))
-                rows.append(RowResult(entity=req.root_entity, data=data))
+                rows.append(
+                    RowResult.model_construct(entity=req.root_entity, data=data, related={})
+                )
             if req.offset:
                 rows = rows[req.offset :]
             if req.limit is not None:
                 rows = rows[: req.limit]
             meta["group_by"] = [grp.field for grp in req.group_by]
-            return QueryResult(rows=rows, meta=meta)
+            return QueryResult.model_construct(rows=rows, meta=meta)
 
         aggregations = self._finalize_aggregations(
             group_state.get((), {}), req.aggregations
@@ -846,89 +1419,83 @@ class CompositeRelationalProvider(RelationalDataProvider):
         }
         return QueryResult(aggregations=agg_results, meta=meta)
 
-    def _extract_group_key(
-        self, row: RowResult, group_by: List[GroupBySpec], root_entity: str
-    ) -> Tuple[Any, ...]:
-        if not group_by:
-            return ()
-        values: List[Any] = []
+    def _make_group_key(
+        self, group_by: List[GroupBySpec], root_entity: str
+    ) -> Callable[[RowResult], Tuple[Any, ...]]:
+        """Return a callable computing the group key tuple of a joined row."""
+        resolved: List[Tuple[str, str]] = []
         for grp in group_by:
             if grp.entity and grp.entity != root_entity:
                 raise NotImplementedError(
                     "Cross-provider aggregations: group_by on non-root entities is not supported"
                 )
-            ent, fld = self._resolve_field_entity(grp.field, grp.entity or root_entity)
-            values.append(self._extract_value(row, ent, fld))
-        return tuple(values)
-
-    def _update_aggregations(
-        self,
-        state: Dict[str, Any],
-        row: RowResult,
-        aggregations: List[AggregationSpec],
-        root_entity: str,
-    ) -> None:
+            resolved.append(self._resolve_field_entity(grp.field, grp.entity or root_entity))
+        if not resolved:
+            return lambda row: ()
+        if all(ent == root_entity for ent, _ in resolved):
+            # Common case: every key column lives on the root row itself.
+            fields = [fld for _, fld in resolved]
+            if len(fields) == 1:
+                field = fields[0]
+                return lambda row: (row.data.get(field),)
+            return lambda row: tuple(map(row.data.get, fields))
+        extractors = [self._make_extractor(ent, fld, root_entity) for ent, fld in resolved]
+        return lambda row: tuple([extract(row) for extract in extractors])
+
+    def _resolve_aggregations(
+        self, aggregations: List[AggregationSpec], root_entity: str
+    ) -> List[_ResolvedAgg]:
+        """Return ``(merge, alias, extractor)`` triples for ``aggregations``."""
+        resolved: List[_ResolvedAgg] = []
         for spec in aggregations:
-            alias = spec.alias or f"{spec.agg}_{spec.field}"
-            ent, field = self._resolve_field_entity(spec.field, root_entity)
-            value = self._extract_value(row, ent, field)
-            if spec.agg == "count":
-                if value is not None:
-                    state[alias] = state.get(alias, 0) + 1
-            elif spec.agg == "count_distinct":
-                seen = state.setdefault(alias, set())
-                if value is not None:
-                    seen.add(value)
-            elif spec.agg == "sum":
-                if value is not None:
-                    state[alias] = state.get(alias, 0) + value
-            elif spec.agg == "min":
-                if value is None:
-                    continue
-                if alias not in state:
-                    state[alias] = value
-                else:
-                    state[alias] = min(state[alias], value)
-            elif spec.agg == "max":
-                if value is None:
-                    continue
-                if alias not in state:
-                    state[alias] = value
-                else:
-                    state[alias] = max(state[alias], value)
-            elif spec.agg == "avg":
-                if value is None:
-                    continue
-                total, count = state.get(alias, (0, 0))
-                state[alias] = (total + value, count + 1)
-            else:
+            merge = _AGG_MERGERS.get(spec.agg)
+            if merge is None:
                 raise NotImplementedError(
                     f"Aggregation '{spec.agg}' is not supported across providers"
                 )
+            extract = self._make_extractor(
+                *self._resolve_field_entity(spec.field, root_entity), root_entity
+            )
+            resolved.append((merge, spec.alias or f"{spec.agg}_{spec.field}", extract))
+        return resolved
+
+    def _aggregate_rows(
+        self,
+        group_state: Dict[Tuple[Any, ...], Dict[str, Any]],
+        rows: List[RowResult],
+        group_key: Callable[[RowResult], Tuple[Any, ...]],
+        resolved_aggs: List[_ResolvedAgg],
+        default_count: bool,
+    ) -> None:
+        """Fold a batch of joined rows into ``group_state``.
+
+        Rows are bucketed by group key first; each aggregation then reduces the
+        non-null values of a bucket with one builtin call and merges that
+        partial result into the running state.
+        """
+        buckets: Dict[Tuple[Any, ...], List[RowResult]] = {}
+        for row in rows:
+            buckets.setdefault(group_key(row), []).append(row)
+
+        for key, bucket in buckets.items():
+            state = group_state.setdefault(key, {})
+            if default_count:
+                state["count"] = state.get("count", 0) + len(bucket)
+            for merge, alias, extract in resolved_aggs:
+                merge(state, alias, [value for value in map(extract, bucket) if value is not None])
 
     def _finalize_aggregations(
         self, state: Dict[str, Any], aggregations: List[AggregationSpec]
     ) -> Dict[str, Any]:
         results: Dict[str, Any] = {}
         for spec in aggregations:
-            alias = spec.alias or f"{spec.agg}_{spec.field}"
-            if spec.agg == "count":
-                results[alias] = state.get(alias, 0)
-            elif spec.agg == "count_distinct":
-                results[alias] = len(state.get(alias, set()))
-            elif spec.agg == "sum":
-                results[alias] = state.get(alias, 0)
-            elif spec.agg == "min":
-                results[alias] = state.get(alias)
-            elif spec.agg == "max":
-                results[alias] = state.get(alias)
-            elif spec.agg == "avg":
-                total, count = state.get(alias, (0, 0))
-                results[alias] = total / count if count else None
-            else:
+            finalize = _AGG_FINALIZERS.get(spec.agg)
+            if finalize is None:
                 raise NotImplementedError(
                     f"Aggregation '{spec.agg}' is not supported across providers"
                 )
+            alias = spec.alias or f"{spec.agg}_{spec.field}"
+            results[alias] = finalize(state, alias)
         return results
 
     def _apply_select_to_rows(
@@ -936,24 +1503,28 @@ class CompositeRelationalProvider(RelationalDataProvider):
     ) -> List[RowResult]:
         if not select:
             return rows
+        columns = []
+        for expr in select:
+            ent, fld = self._resolve_field_entity(expr.expr, root_entity)
+            columns.append((ent, expr.alias or fld, self._make_extractor(ent, fld, root_entity)))
         projected: List[RowResult] = []
         for row in rows:
             data: Dict[str, Any] = {}
             related: Dict[str, Dict[str, Any]] = {}
-            for expr in select:
-                ent, fld = self._resolve_field_entity(expr.expr, root_entity)
-                alias = expr.alias or fld
-                value = self._extract_value(row, ent, fld)
+            for ent, alias, extract in columns:
+                value = extract(row)
                 if ent == row.entity:
                     data[alias] = value
                 else:
                     related.setdefault(ent, {})[alias] = value
-            projected.append(RowResult(entity=row.entity, data=data, related=related))
+            projected.append(
+                RowResult.model_construct(entity=row.entity, data=data, related=related)
+            )
         return projected
 
     def _resolve_field_entity(self, field: str, root_entity: str) -> Tuple[str, str]:
-        if "." in field:
-            ent, fld = field.split(".", 1)
+        ent, sep, fld = field.partition(".")
+        if sep:
             return ent, fld
         return root_entity, field
 
@@ -962,70 +1533,96 @@ class CompositeRelationalProvider(RelationalDataProvider):
             return row.data.get(field)
         return row.related.get(entity, {}).get(field)
 
+    @staticmethod
+    def _make_extractor(
+        entity: str, field: str, row_entity: str
+    ) -> Callable[[RowResult], Any]:
+        """Specialize :meth:`_extract_value` for rows whose entity is ``row_entity``.
+
+        Hot loops build the extractor once and skip the per-row entity check.
+        """
+        if entity == row_entity:
+            return lambda row: row.data.get(field)
+        return lambda row: row.related.get(entity, _EMPTY_RELATED).get(field)
+
     def _effective_cardinality(
         self, relation: RelationDescriptor, left_entity: str, right_entity: str
     ) -> str:
-        if (
-            left_entity == relation.join.from_entity
-            and right_entity == relation.join.to_entity
-        ):
-            return relation.cardinality
-        if (
-            left_entity == relation.join.to_entity
-            and right_entity == relation.join.from_entity
-        ):
-            mapping = {
-                "1_to_1": "1_to_1",
-                "1_to_many": "many_to_1",
-                "many_to_1": "1_to_many",
-                "many_to_many": "many_to_many",
-            }
-            if relation.cardinality not in mapping:
+        plan = self._relation_plans.get(relation.name) or _RelationPlan.from_descriptor(
+            relation
+        )
+        if left_entity == plan.from_entity and right_entity == plan.to_entity:
+            return plan.cardinality
+        if left_entity == plan.to_entity and right_entity == plan.from_entity:
+            reversed_cardinality = _REVERSED_CARDINALITY.get(plan.cardinality)
+            if reversed_cardinality is None:
                 raise ValueError(
-                    f"Unknown cardinality '{relation.cardinality}' for relation '{relation.name}'"
+                    f"Unknown cardinality '{plan.cardinality}' for relation '{plan.name}'"
                 )
-            return mapping[relation.cardinality]
+            return reversed_cardinality
         raise ValueError(
-            f"Relation '{relation.name}' does not connect entities {left_entity} and {right_entity}"
+            f"Relation '{plan.name}' does not connect entities {left_entity} and {right_entity}"
         )
 
-    def _remote_limit_for_cardinality(self, cardinality: str, key_count: int) -> int:
-        if cardinality in {"1_to_1", "many_to_1"}:
-            limit = key_count if key_count else self.max_right_rows_per_batch
-            return min(self.max_right_rows_per_batch, limit)
-        return self.max_right_rows_per_batch
-
-    def _collect_entities_from_filter(self, clause: FilterClause, root_entity: str) -> List[str]:
-        if isinstance(clause, ComparisonFilter):
-            if clause.entity:
-                return self._entities_for_reference(clause.entity, root_entity)
-            if "." in clause.field:
-                return self._entities_for_reference(clause.field.split(".", 1)[0], root_entity)
-            return [root_entity]
-
-        if isinstance(clause, LogicalFilter):
-            entities: List[str] = []
-            for sub in clause.clauses:
-                entities.extend(self._collect_entities_from_filter(sub, root_entity))
-            return entities
+    def _collect_entities_into(
+        self, clause: FilterClause, root_entity: str, out: Set[str]
+    ) -> None:
+        """Add entities referenced by ``clause`` to ``out`` without recursion."""
+        stack: List[FilterClause] = [clause]
+        collectors = self._entity_collectors
+        while stack:
+            node = stack.pop()
+            collector = collectors.get(type(node))
+            if collector is None:
+                # Subclasses of the filter models miss the exact-type lookup.
+                collector = next(
+                    (fn for cls, fn in collectors.items() if isinstance(node, cls)),
+                    None,
+                )
+                if collector is None:
+                    out.add(root_entity)
+                    continue
+            collector(node, root_entity, out, stack)
 
-        return [root_entity]
+    def _collect_logical_entities(
+        self,
+        clause: LogicalFilter,
+        root_entity: str,
+        out: Set[str],
+        stack: List[FilterClause],
+    ) -> None:
+        stack.extend(clause.clauses)
+
+    def _collect_comparison_entities(
+        self,
+        clause: ComparisonFilter,
+        root_entity: str,
+        out: Set[str],
+        stack: List[FilterClause],
+    ) -> None:
+        if clause.entity:
+            out.update(self._entities_for_reference(clause.entity, root_entity))
+            return
+        ref, sep, _ = clause.field.partition(".")
+        if sep:
+            out.update(self._entities_for_reference(ref, root_entity))
+        else:
+            out.add(root_entity)
 
     def _entities_for_reference(self, ref: str, root_entity: str) -> List[str]:
-        entity_names = {e.name for e in self.entities}
-        if ref in entity_names:
+        if ref in self._entity_names:
             return [ref]
 
-        for rel in self.relations:
-            if rel.name == ref:
-                return [rel.from_entity, rel.to_entity]
+        rel = self._relation_index.get(ref)
+        if rel is not None:
+            return [rel.from_entity, rel.to_entity]
 
         return [root_entity]
 
     def _handle_semantic_only(self, req: SemanticOnlyRequest) -> SemanticOnlyResult:
-        for child in self.children.values():
-            if req.entity in getattr(child, "_entity_index", {}):
-                return child._handle_semantic_only(req)
+        for child_name, ents in self._provider_entities.items():
+            if req.entity in ents:
+                return self.children[child_name]._handle_semantic_only(req)
         raise KeyError(f"Entity '{req.entity}' not found in any child provider")
 
     def _handle_query(self, req: RelationalQuery):
@@ -1038,9 +1635,7 @@ class CompositeRelationalProvider(RelationalDataProvider):
     def _collect_involved_entities(self, req: RelationalQuery) -> Set[str]:
         involved_entities: Set[str] = {req.root_entity}
         if req.filters:
-            involved_entities.update(
-                self._collect_entities_from_filter(req.filters, req.root_entity)
-            )
+            self._collect_entities_into(req.filters, req.root_entity, involved_entities)
         for clause in req.semantic_clauses:
             involved_entities.add(clause.entity)
         for rel_name in req.relations:
@@ -1052,14 +1647,15 @@ class CompositeRelationalProvider(RelationalDataProvider):
             if grp.entity:
                 involved_entities.add(grp.entity)
         for agg in req.aggregations:
-            if "." in agg.field:
-                ent, _ = agg.field.split(".", 1)
+            ent, sep, _ = agg.field.partition(".")
+            if sep:
                 involved_entities.add(ent)
         for sel in req.select:
             expr = getattr(sel, "expr", None)
-            if isinstance(expr, str) and "." in expr:
-                ent, _ = expr.split(".", 1)
-                involved_entities.add(ent)
+            if isinstance(expr, str):
+                ent, sep, _ = expr.partition(".")
+                if sep:
+                    involved_entities.add(ent)
         return involved_entities
 
     def describe(self):
@@ -106,8 +106,10 @@ class PandasRelationalDataProvider(RelationalDataProvider):
     def _resolve_column(self, df: pd.DataFrame, root_entity: str, field: str, entity: Optional[str] = None) -> str:
         ent = entity
         fld = field
-        if ent is None and "." in field:
-            ent, fld = field.split(".", 1)
+        if ent is None:
+            prefix, sep, rest = field.partition(".")
+            if sep:
+                ent, fld = prefix, rest
         if ent is None or ent == root_entity:
             if fld in df.columns:
                 return fld
@@ -126,7 +128,8 @@ class PandasRelationalDataProvider(RelationalDataProvider):
                 referenced.add(ent)
 
         def entity_from_field(field: str) -> Optional[str]:
-            return field.split(".", 1)[0] if "." in field else None
+            ent, sep, _ = field.partition(".")
+            return ent if sep else None
 
         for expr in req.select:
             add_entity(entity_from_field(expr.expr))
@@ -416,15 +419,17 @@ class PandasRelationalDataProvider(RelationalDataProvider):
         cols: List[str] = []
         alias_map: Dict[Hashable, Hashable] = {}
         for expr in select:
-            if "." in expr.expr:
-                ent, fld = expr.expr.split(".", 1)
+            ent, sep, fld = expr.expr.partition(".")
+            if sep:
                 col = self._resolve_column(df, root_entity, fld, ent)
             else:
                 col = self._resolve_column(df, root_entity, expr.expr)
             cols.append(col)
             if expr.alias:
                 alias_map[col] = expr.alias
-        selected = df[cols].copy()
+        # Object dtype keeps row values as Python scalars: an all-numeric
+        # projection would otherwise yield numpy scalars from iterrows.
+        selected = df[cols].astype(object)
         if alias_map:
             selected.columns = [alias_map.get(col, col) for col in selected.columns]
         return selected
@@ -455,9 +460,8 @@ class PandasRelationalDataProvider(RelationalDataProvider):
         if req.select:
             base_columns = []
             for expr in req.select:
-                if "." in expr.expr:
-                    ent, fld = expr.expr.split(".", 1)
-                else:
+                ent, sep, fld = expr.expr.partition(".")
+                if not sep:
                     ent, fld = req.root_entity, expr.expr
 
                 if ent == req.root_entity:
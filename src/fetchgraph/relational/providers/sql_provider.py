@@ -3,8 +3,9 @@ from __future__ import annotations
 """SQL-backed relational provider that builds queries directly."""
 
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any, DefaultDict, Dict, List, Mapping, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 from ..models import (
     AggregationResult,
@@ -25,6 +26,102 @@ from ..models import (
 from ..semantic.backend import SemanticBackend
 from .base import RelationalDataProvider
 
+# Rows pulled from the cursor per round-trip when materializing results.
+_FETCH_BATCH_SIZE = 1024
+# Maximum number of cached query plans per provider before the cache is reset.
+_PLAN_CACHE_SIZE = 256
+_COLUMN_REF_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=1024)
+def _placeholders(count: int) -> str:
+    """Return ``count`` comma-separated ``?`` placeholders."""
+    return ",".join(["?"] * count)
+
+
+@lru_cache(maxsize=256)
+def _case_whens(count: int) -> str:
+    """Return ``count`` space-separated ``WHEN ? THEN ?`` branches."""
+    return " ".join(["WHEN ? THEN ?"] * count)
+
+
+def _is_string_like(val: Any) -> bool:
+    if isinstance(val, str):
+        return True
+    if isinstance(val, (list, tuple, set)):
+        return all(isinstance(v, str) for v in val)
+    return False
+
+
+def _sequence_value(op: str, value: Any) -> Sequence[Any]:
+    if not isinstance(value, (list, tuple)):
+        raise TypeError(f"Values for '{op}' operator must be a list or tuple")
+    return value
+
+
+def _binary_comparison(sql_op: str) -> Callable[[str, Any, List[Any]], str]:
+    def build(column: str, value: Any, params: List[Any]) -> str:
+        params.append(value)
+        return f"{column} {sql_op} ?"
+
+    return build
+
+
+def _in_comparison(column: str, value: Any, params: List[Any]) -> str:
+    values = _sequence_value("in", value)
+    params.extend(values)
+    return f"{column} IN ({_placeholders(len(values))})" if values else "1=0"
+
+
+def _not_in_comparison(column: str, value: Any, params: List[Any]) -> str:
+    values = _sequence_value("not_in", value)
+    params.extend(values)
+    return f"{column} NOT IN ({_placeholders(len(values))})" if values else "1=1"
+
+
+def _like_comparison(column: str, value: Any, params: List[Any]) -> str:
+    params.append(f"%{value}%")
+    return f"{column} LIKE ?"
+
+
+def _ilike_comparison(column: str, value: Any, params: List[Any]) -> str:
+    params.append(f"%{str(value).lower()}%")
+    return f"LOWER({column}) LIKE ?"
+
+
+def _soft_eq_comparison(column: str, value: Any, params: List[Any]) -> str:
+    params.append(value)
+    params.append(f"%{value}%")
+    return f"({column} = ? OR {column} LIKE ?)"
+
+
+def _soft_ne_comparison(column: str, value: Any, params: List[Any]) -> str:
+    params.append(value)
+    params.append(f"%{value}%")
+    return f"({column} <> ? AND {column} NOT LIKE ?)"
+
+
+# Strict comparisons: ``column`` is used as-is and ``value`` is bound verbatim.
+_COMPARISON_BUILDERS: Dict[str, Callable[[str, Any, List[Any]], str]] = {
+    **{op: _binary_comparison(op) for op in ("=", "!=", ">", "<", ">=", "<=")},
+    "in": _in_comparison,
+    "not_in": _not_in_comparison,
+    "like": _like_comparison,
+    "ilike": _ilike_comparison,
+}
+
+# Soft string comparisons: ``column`` is already LOWER(TRIM(...)) and ``value``
+# has been normalized with ``_normalize_literal``.
+_SOFT_COMPARISON_BUILDERS: Dict[str, Callable[[str, Any, List[Any]], str]] = {
+    "=": _soft_eq_comparison,
+    "!=": _soft_ne_comparison,
+    "in": _in_comparison,
+    "not_in": _not_in_comparison,
+    "like": _like_comparison,
+    "ilike": _like_comparison,
+}
+_SOFT_SCALAR_OPS = frozenset({"=", "!=", "like", "ilike"})
+
 
 @dataclass(frozen=True)
 class AliasInfo:
@@ -39,6 +136,20 @@ class JoinAliasIndex:
     root_alias: str
     by_key: dict[str, AliasInfo]
     by_entity: dict[str, List[AliasInfo]]
+    # Every identifier that resolves unambiguously, mapped to its alias.
+    resolved: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Value-independent SQL fragments for one query shape."""
+
+    head_sql: str
+    index: JoinAliasIndex
+    base_columns: List[str]
+    related_columns: Dict[str, Tuple[str, str]]
+    group_cols: List[str]
+    group_sql: str
 
 
 class SqlRelationalDataProvider(RelationalDataProvider):
@@ -67,39 +178,71 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         *,
         default_schema: Optional[str] = None,
         table_names: Optional[Mapping[str, str]] = None,
+        values_in_threshold: Optional[int] = None,
     ):
         super().__init__(name, entities, relations)
         self.connection = connection
         self.semantic_backend = semantic_backend
         self.primary_keys = primary_keys or {}
         self._entity_index: Dict[str, EntityDescriptor] = {e.name: e for e in entities}
+        # Primary keys declared through column roles; explicit ``primary_keys``
+        # overrides are still consulted first in :meth:`_pk_column`.
+        self._pk_index: Dict[str, Optional[str]] = {
+            e.name: next((c.name for c in e.columns if c.role == "primary_key"), None)
+            for e in entities
+        }
+        self._relation_index: Dict[str, RelationDescriptor] = {}
+        self._ambiguous_relation_names: Set[str] = set()
+        for rel in relations:
+            if rel.name in self._relation_index or rel.name in self._ambiguous_relation_names:
+                self._relation_index.pop(rel.name, None)
+                self._ambiguous_relation_names.add(rel.name)
+            else:
+                self._relation_index[rel.name] = rel
         self.default_schema = default_schema
         self.table_names: Dict[str, str] = dict(table_names or {})
+        # Semantic filters matching more IDs than this are emitted as
+        # ``IN (SELECT column1 FROM (VALUES (?), ...))`` so engines that plan
+        # long IN-lists as linear scans can hash-join them instead. Disabled by
+        # default: SQLite already indexes long IN-lists itself.
+        self.values_in_threshold = values_in_threshold
+        # Filter node builders keyed by exact model class.
+        self._filter_builders: Dict[type, Callable[..., Optional[str]]] = {
+            ComparisonFilter: self._build_comparison_filter,
+            LogicalFilter: self._build_logical_filter,
+        }
+        # Quoted forms of schema identifiers; anything else is quoted on demand.
+        self._quoted_idents: Dict[str, str] = {}
+        for ent in entities:
+            for ident in (ent.name, *(col.name for col in ent.columns)):
+                self._quoted_idents.setdefault(ident, f'"{ident}"')
+        # Column references are keyed by table alias (t0, t1, ...) and column.
+        self._column_refs: Dict[Tuple[str, str], str] = {}
+        # Plans embed resolved table names; reset this cache if ``table_names``
+        # or ``default_schema`` is changed after queries have run.
+        self._plan_cache: Dict[Tuple[Any, ...], QueryPlan] = {}
 
     # --- helper methods ---
     def _pk_column(self, entity: str) -> Optional[str]:
         if entity in self.primary_keys:
             return self.primary_keys[entity]
-        desc = self._entity_index.get(entity)
-        if not desc:
-            return None
-        for col in desc.columns:
-            if col.role == "primary_key":
-                return col.name
-        return None
+        return self._pk_index.get(entity)
 
     def _relation_by_name(self, name: str) -> RelationDescriptor:
-        matches = [rel for rel in self.relations if rel.name == name]
-        if len(matches) == 1:
-            return matches[0]
-        if len(matches) == 0:
-            raise KeyError(f"Relation '{name}' not found")
-        raise ValueError(
-            "Multiple relations share the same name; set distinct relation.name in schema."
-        )
+        relation = self._relation_index.get(name)
+        if relation is not None:
+            return relation
+        if name in self._ambiguous_relation_names:
+            raise ValueError(
+                "Multiple relations share the same name; set distinct relation.name in schema."
+            )
+        raise KeyError(f"Relation '{name}' not found")
 
     def _quote_ident(self, name: str) -> str:
-        return f'"{name}"'
+        quoted = self._quoted_idents.get(name)
+        if quoted is None:
+            return f'"{name}"'
+        return quoted
 
     def _quote_table(self, name: str) -> str:
         if "." in name:
@@ -113,9 +256,20 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         return table
 
     def _column_ref(self, entity: str, column: str) -> str:
-        return f"{self._quote_ident(entity)}.{self._quote_ident(column)}"
+        key = (entity, column)
+        ref = self._column_refs.get(key)
+        if ref is None:
+            ref = f"{self._quote_ident(entity)}.{self._quote_ident(column)}"
+            if len(self._column_refs) >= _COLUMN_REF_CACHE_SIZE:
+                self._column_refs.clear()
+            self._column_refs[key] = ref
+        return ref
 
     def _lookup_alias(self, identifier: str, index: JoinAliasIndex) -> str:
+        alias = index.resolved.get(identifier)
+        if alias is not None:
+            return alias
+
         if identifier == index.root_entity:
             return index.root_alias
 
@@ -134,8 +288,10 @@ class SqlRelationalDataProvider(RelationalDataProvider):
     def _resolve_field(self, root_entity: str, field: str, entity: Optional[str]) -> Tuple[str, str]:
         ent = entity
         fld = field
-        if ent is None and "." in field:
-            ent, fld = field.split(".", 1)
+        if ent is None:
+            prefix, sep, rest = field.partition(".")
+            if sep:
+                ent, fld = prefix, rest
         ent = ent or root_entity
         return ent, fld
 
@@ -159,76 +315,19 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         *,
         case_sensitive: bool,
     ) -> str:
-        def _is_string_like(val: Any) -> bool:
-            if isinstance(val, str):
-                return True
-            if isinstance(val, (list, tuple, set)):
-                return all(isinstance(v, str) for v in val)
-            return False
-
-        soft_applicable = (not case_sensitive) and _is_string_like(value) and op in {
-            "=",
-            "!=",
-            "in",
-            "not_in",
-            "like",
-            "ilike",
-        }
-
-        if soft_applicable:
+        if not case_sensitive and op in _SOFT_COMPARISON_BUILDERS and _is_string_like(value):
             norm_value = self._normalize_literal(value)
-            norm_column = f"LOWER(TRIM({column}))"
+            # Scalar soft operators need a single string; otherwise fall back
+            # to the strict comparison below.
+            if op not in _SOFT_SCALAR_OPS or isinstance(norm_value, str):
+                return _SOFT_COMPARISON_BUILDERS[op](
+                    f"LOWER(TRIM({column}))", norm_value, params
+                )
 
-            if op in {"=", "!=", "like", "ilike"} and not isinstance(norm_value, str):
-                soft_applicable = False
-            else:
-                if op == "=":
-                    params.append(norm_value)
-                    params.append(f"%{norm_value}%")
-                    return f"({norm_column} = ? OR {norm_column} LIKE ?)"
-                if op == "!=":
-                    params.append(norm_value)
-                    params.append(f"%{norm_value}%")
-                    return f"({norm_column} <> ? AND {norm_column} NOT LIKE ?)"
-                if op == "in":
-                    if not isinstance(norm_value, (list, tuple)):
-                        raise TypeError("Values for 'in' operator must be a list or tuple")
-                    placeholders = ",".join("?" for _ in norm_value)
-                    params.extend(norm_value)
-                    return f"{norm_column} IN ({placeholders})" if norm_value else "1=0"
-                if op == "not_in":
-                    if not isinstance(norm_value, (list, tuple)):
-                        raise TypeError("Values for 'not_in' operator must be a list or tuple")
-                    placeholders = ",".join("?" for _ in norm_value)
-                    params.extend(norm_value)
-                    return f"{norm_column} NOT IN ({placeholders})" if norm_value else "1=1"
-                if op in {"like", "ilike"}:
-                    pattern = f"%{norm_value}%"
-                    params.append(pattern)
-                    return f"{norm_column} LIKE ?"
-
-        if op in {"=", "!=", ">", "<", ">=", "<="}:
-            params.append(value)
-            return f"{column} {op} ?"
-        if op == "in":
-            if not isinstance(value, (list, tuple)):
-                raise TypeError("Values for 'in' operator must be a list or tuple")
-            placeholders = ",".join("?" for _ in value)
-            params.extend(value)
-            return f"{column} IN ({placeholders})" if value else "1=0"
-        if op == "not_in":
-            if not isinstance(value, (list, tuple)):
-                raise TypeError("Values for 'not_in' operator must be a list or tuple")
-            placeholders = ",".join("?" for _ in value)
-            params.extend(value)
-            return f"{column} NOT IN ({placeholders})" if value else "1=1"
-        if op == "like":
-            params.append(f"%{value}%")
-            return f"{column} LIKE ?"
-        if op == "ilike":
-            params.append(f"%{str(value).lower()}%")
-            return f"LOWER({column}) LIKE ?"
-        raise ValueError(f"Unsupported comparison operator: {op}")
+        builder = _COMPARISON_BUILDERS.get(op)
+        if builder is None:
+            raise ValueError(f"Unsupported comparison operator: {op}")
+        return builder(column, value, params)
 
     def _build_filters(
         self,
@@ -241,19 +340,44 @@ class SqlRelationalDataProvider(RelationalDataProvider):
     ) -> Optional[str]:
         if clause is None:
             return None
-        if isinstance(clause, ComparisonFilter):
-            ent, fld = self._resolve_field(root_entity, clause.field, clause.entity)
-            col = self._column_ref(self._lookup_alias(ent, index), fld)
-            return self._build_comparison(col, clause.op, clause.value, params, case_sensitive=case_sensitive)
-        if isinstance(clause, LogicalFilter):
-            parts: List[str] = []
-            for sub in clause.clauses:
-                sub_sql = self._build_filters(sub, root_entity, index, params, case_sensitive=case_sensitive)
-                if sub_sql:
-                    parts.append(f"({sub_sql})")
-            joiner = " AND " if clause.op == "and" else " OR "
-            return joiner.join(parts) if parts else None
-        return None
+        builder = self._filter_builders.get(type(clause))
+        if builder is None:
+            # Subclasses of the filter models miss the exact-type lookup.
+            builder = next(
+                (fn for cls, fn in self._filter_builders.items() if isinstance(clause, cls)),
+                None,
+            )
+            if builder is None:
+                return None
+        return builder(clause, root_entity, index, params, case_sensitive)
+
+    def _build_comparison_filter(
+        self,
+        clause: ComparisonFilter,
+        root_entity: str,
+        index: JoinAliasIndex,
+        params: List[Any],
+        case_sensitive: bool,
+    ) -> Optional[str]:
+        ent, fld = self._resolve_field(root_entity, clause.field, clause.entity)
+        col = self._column_ref(self._lookup_alias(ent, index), fld)
+        return self._build_comparison(col, clause.op, clause.value, params, case_sensitive=case_sensitive)
+
+    def _build_logical_filter(
+        self,
+        clause: LogicalFilter,
+        root_entity: str,
+        index: JoinAliasIndex,
+        params: List[Any],
+        case_sensitive: bool,
+    ) -> Optional[str]:
+        parts: List[str] = []
+        for sub in clause.clauses:
+            sub_sql = self._build_filters(sub, root_entity, index, params, case_sensitive=case_sensitive)
+            if sub_sql:
+                parts.append(f"({sub_sql})")
+        joiner = " AND " if clause.op == "and" else " OR "
+        return joiner.join(parts) if parts else None
 
     def _build_semantic_clauses(
         self,
@@ -293,15 +417,13 @@ class SqlRelationalDataProvider(RelationalDataProvider):
             match_ids = [m.id for m in matches]
             target_col = self._column_ref(self._lookup_alias(clause.entity, index), pk)
 
-            cases = " ".join(["WHEN ? THEN ?" for _ in match_ids])
-            case_expr = f"CASE {target_col} {cases} ELSE 0 END"
+            case_expr = f"CASE {target_col} {_case_whens(len(match_ids))} ELSE 0 END"
             for match in matches:
                 score_params.extend([match.id, match.score])
             score_exprs.append(case_expr)
 
             if clause.mode == "filter":
-                placeholders = ",".join("?" for _ in match_ids)
-                conditions.append(f"{target_col} IN ({placeholders})")
+                conditions.append(self._id_list_condition(target_col, len(match_ids)))
                 condition_params.extend(match_ids)
 
         order_expr = None
@@ -312,32 +434,42 @@ class SqlRelationalDataProvider(RelationalDataProvider):
 
         return conditions, order_expr, condition_params, score_params
 
+    def _id_list_condition(self, column: str, count: int) -> str:
+        threshold = self.values_in_threshold
+        if threshold is not None and count > threshold:
+            rows = ",".join(["(?)"] * count)
+            return f"{column} IN (SELECT column1 FROM (VALUES {rows}))"
+        return f"{column} IN ({_placeholders(count)})"
+
     def _build_default_select(
         self, root_entity: str, index: JoinAliasIndex
     ) -> Tuple[List[str], List[str]]:
         select_parts: List[str] = []
         base_columns: List[str] = []
 
+        column_ref = self._column_ref
+        quote_ident = self._quote_ident
+        select_alias = self._select_alias
+        entity_index = self._entity_index
+        append = select_parts.append
+
         root_alias = index.root_alias
-        for col in self._entity_index[root_entity].columns:
-            select_parts.append(
-                f"{self._column_ref(root_alias, col.name)} AS {self._quote_ident(col.name)}"
-            )
+        for col in entity_index[root_entity].columns:
+            append(f"{column_ref(root_alias, col.name)} AS {quote_ident(col.name)}")
             base_columns.append(col.name)
 
+        by_entity = index.by_entity
         for info in index.by_key.values():
-            desc = self._entity_index.get(info.entity)
+            desc = entity_index.get(info.entity)
             if not desc:
                 continue
             if info.entity == index.root_entity:
                 label = info.key
             else:
-                label = info.entity if len(index.by_entity.get(info.entity, [])) == 1 else info.key
+                label = info.entity if len(by_entity.get(info.entity, [])) == 1 else info.key
             for col in desc.columns:
-                aliased = self._select_alias(label, col.name, root_entity)
-                select_parts.append(
-                    f"{self._column_ref(info.alias, col.name)} AS {self._quote_ident(aliased)}"
-                )
+                aliased = select_alias(label, col.name, root_entity)
+                append(f"{column_ref(info.alias, col.name)} AS {quote_ident(aliased)}")
         return select_parts, base_columns
 
     def _build_select_from_expressions(
@@ -346,17 +478,23 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         select_parts: List[str] = []
         base_columns: List[str] = []
         related_columns: Dict[str, Tuple[str, str]] = {}
+        column_ref = self._column_ref
+        lookup_alias = self._lookup_alias
+        quote_ident = self._quote_ident
+        resolve_field = self._resolve_field
+        select_alias = self._select_alias
+        root_entity = req.root_entity
         for expr in req.select:
-            ent, fld = self._resolve_field(req.root_entity, expr.expr, None)
-            alias = self._select_alias(ent, fld, req.root_entity)
+            ent, fld = resolve_field(root_entity, expr.expr, None)
+            alias = select_alias(ent, fld, root_entity)
             target_alias = expr.alias or alias
-            if ent == req.root_entity:
+            if ent == root_entity:
                 base_columns.append(target_alias)
             else:
                 field_alias = expr.alias or fld
                 related_columns[target_alias] = (ent, field_alias)
             select_parts.append(
-                f"{self._column_ref(self._lookup_alias(ent, index), fld)} AS {self._quote_ident(target_alias)}"
+                f"{column_ref(lookup_alias(ent, index), fld)} AS {quote_ident(target_alias)}"
             )
         return select_parts, base_columns, related_columns
 
@@ -373,22 +511,28 @@ class SqlRelationalDataProvider(RelationalDataProvider):
             root_entity=req.root_entity, root_alias=root_alias, by_key=by_key, by_entity=by_entity
         )
 
-        def _entity_present(entity: str) -> bool:
-            return entity == index.root_entity or entity in index.by_entity
+        root_entity = req.root_entity
+        relation_by_name = self._relation_by_name
+        column_ref = self._column_ref
+        lookup_alias = self._lookup_alias
+        quote_ident = self._quote_ident
 
         for rel_name in req.relations:
-            relation = self._relation_by_name(rel_name)
-
-            if _entity_present(relation.from_entity):
-                left_entity = relation.from_entity
-                right_entity = relation.to_entity
-                left_field = relation.join.from_column
-                right_field = relation.join.to_column
-            elif _entity_present(relation.to_entity):
-                left_entity = relation.to_entity
-                right_entity = relation.from_entity
-                left_field = relation.join.to_column
-                right_field = relation.join.from_column
+            relation = relation_by_name(rel_name)
+            join = relation.join
+            from_entity = relation.from_entity
+            to_entity = relation.to_entity
+
+            if from_entity == root_entity or from_entity in by_entity:
+                left_entity = from_entity
+                right_entity = to_entity
+                left_field = join.from_column
+                right_field = join.to_column
+            elif to_entity == root_entity or to_entity in by_entity:
+                left_entity = to_entity
+                right_entity = from_entity
+                left_field = join.to_column
+                right_field = join.from_column
             else:
                 raise ValueError(f"Neither entity of relation '{relation.name}' present in query")
 
@@ -409,16 +553,25 @@ class SqlRelationalDataProvider(RelationalDataProvider):
             by_key[key] = info
             by_entity[right_entity].append(info)
 
-            join_type = relation.join.join_type.upper()
+            join_type = join.join_type.upper()
             if join_type == "OUTER":
                 join_type = "FULL OUTER"
             joins.append(
-                f"{join_type} JOIN {self._quote_table(self._table_name(right_entity))} AS {self._quote_ident(right_alias)} "
-                f"ON {self._column_ref(self._lookup_alias(left_entity, index), left_field)} = {self._column_ref(right_alias, right_field)}"
+                f"{join_type} JOIN {self._quote_table(self._table_name(right_entity))} AS {quote_ident(right_alias)} "
+                f"ON {column_ref(lookup_alias(left_entity, index), left_field)} = {column_ref(right_alias, right_field)}"
             )
 
+        # Same precedence as _lookup_alias: root entity, relation key, then an
+        # entity joined exactly once.
+        resolved = {ent: infos[0].alias for ent, infos in by_entity.items() if len(infos) == 1}
+        resolved.update((key, info.alias) for key, info in by_key.items())
+        resolved[req.root_entity] = root_alias
         return joins, JoinAliasIndex(
-            root_entity=req.root_entity, root_alias=root_alias, by_key=by_key, by_entity=dict(by_entity)
+            root_entity=req.root_entity,
+            root_alias=root_alias,
+            by_key=by_key,
+            by_entity=dict(by_entity),
+            resolved=resolved,
         )
 
     def _build_aggregations(
@@ -452,20 +605,95 @@ class SqlRelationalDataProvider(RelationalDataProvider):
 
         return select_parts, group_cols
 
-    # --- core handlers ---
-    def _handle_query(self, req: RelationalQuery):
+    def _query_plan(self, req: RelationalQuery) -> QueryPlan:
+        """Return the cached :class:`QueryPlan` for the shape of ``req``.
+
+        Joins, aliases, select lists and grouping depend only on the query's
+        structure, so they are built once per shape; filters, semantic clauses
+        and paging are rendered per call because they carry values.
+        """
+        key = (
+            req.root_entity,
+            tuple(req.relations),
+            tuple((expr.expr, expr.alias) for expr in req.select),
+            tuple((grp.entity, grp.field, grp.alias) for grp in req.group_by),
+            tuple((spec.field, spec.agg, spec.alias) for spec in req.aggregations),
+        )
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            plan = self._build_query_plan(req)
+            if len(self._plan_cache) >= _PLAN_CACHE_SIZE:
+                self._plan_cache.clear()
+            self._plan_cache[key] = plan
+        return plan
+
+    def _build_query_plan(self, req: RelationalQuery) -> QueryPlan:
         joins, index = self._build_relations(req)
 
-        if req.group_by or req.aggregations:
-            return self._handle_aggregate_query(req, joins, index)
-
         related_columns: Dict[str, Tuple[str, str]] = {}
-
-        if req.select:
+        base_columns: List[str] = []
+        group_cols: List[str] = []
+        if req.group_by or req.aggregations:
+            select_parts, group_cols = self._build_aggregations(req, index)
+        elif req.select:
             select_parts, base_columns, related_columns = self._build_select_from_expressions(req, index)
         else:
             select_parts, base_columns = self._build_default_select(req.root_entity, index)
 
+        root_alias = self._lookup_alias(req.root_entity, index)
+        head = [
+            "SELECT ",
+            ", ".join(select_parts),
+            " FROM ",
+            self._quote_table(self._table_name(req.root_entity)),
+            " AS ",
+            self._quote_ident(root_alias),
+        ]
+        for join in joins:
+            head.append(" ")
+            head.append(join)
+        return QueryPlan(
+            head_sql="".join(head),
+            index=index,
+            base_columns=base_columns,
+            related_columns=related_columns,
+            group_cols=group_cols,
+            group_sql=f" GROUP BY {', '.join(group_cols)}" if group_cols else "",
+        )
+
+    def _assemble_sql(
+        self,
+        plan: QueryPlan,
+        req: RelationalQuery,
+        conditions: List[str],
+        semantic_order: Optional[str],
+    ) -> str:
+        parts = [plan.head_sql]
+        if conditions:
+            parts.append(" WHERE ")
+            parts.append(" AND ".join(conditions))
+        if plan.group_sql:
+            parts.append(plan.group_sql)
+        if semantic_order:
+            parts.append(" ORDER BY ")
+            parts.append(semantic_order)
+        if req.limit is not None:
+            parts.append(f" LIMIT {req.limit}")
+        if req.offset:
+            parts.append(f" OFFSET {req.offset}")
+        return "".join(parts)
+
+    # --- core handlers ---
+    def _handle_query(self, req: RelationalQuery):
+        plan = self._query_plan(req)
+
+        if req.group_by or req.aggregations:
+            return self._handle_aggregate_query(req, plan)
+
+        index = plan.index
+        base_columns = plan.base_columns
+        related_columns = plan.related_columns
+
         conditions: List[str] = []
         params: List[Any] = []
 
@@ -484,43 +712,29 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         if score_params:
             params.extend(score_params)
 
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        order_clause = f"ORDER BY {semantic_order}" if semantic_order else ""
-        limit_clause = f"LIMIT {req.limit}" if req.limit is not None else ""
-        offset_clause = f"OFFSET {req.offset}" if req.offset else ""
-
-        root_alias = self._lookup_alias(req.root_entity, index)
-        sql_parts = [
-            "SELECT",
-            ", ".join(select_parts),
-            "FROM",
-            f"{self._quote_table(self._table_name(req.root_entity))} AS {self._quote_ident(root_alias)}",
-        ]
-        if joins:
-            sql_parts.append(" ".join(joins))
-        if where_clause:
-            sql_parts.append(where_clause)
-        if order_clause:
-            sql_parts.append(order_clause)
-        if limit_clause:
-            sql_parts.append(limit_clause)
-        if offset_clause:
-            sql_parts.append(offset_clause)
-
-        sql = " ".join(part for part in sql_parts if part)
+        sql = self._assemble_sql(plan, req, conditions, semantic_order)
         cursor = self.connection.cursor()
         cursor.execute(sql, params)
         columns = [desc[0] for desc in cursor.description]
-        rows = [
-            self._row_from_db(row, columns, base_columns, req.root_entity, related_columns or None)
-            for row in cursor.fetchall()
-        ]
+        data_plan, related_plan = self._row_plan(columns, base_columns, related_columns or None)
+        root_entity = req.root_entity
+        rows: List[RowResult] = []
+        for row in self._iter_cursor_rows(cursor):
+            related: Dict[str, Dict[str, Any]] = {}
+            for ent, fld, idx in related_plan:
+                related.setdefault(ent, {})[fld] = row[idx]
+            rows.append(
+                RowResult.model_construct(
+                    entity=root_entity,
+                    data={col: row[idx] for col, idx in data_plan},
+                    related=related,
+                )
+            )
         return QueryResult(rows=rows, meta={"relations_used": req.relations})
 
-    def _handle_aggregate_query(
-        self, req: RelationalQuery, joins: Sequence[str], index: JoinAliasIndex
-    ):
-        select_parts, group_cols = self._build_aggregations(req, index)
+    def _handle_aggregate_query(self, req: RelationalQuery, plan: QueryPlan):
+        index = plan.index
+        group_cols = plan.group_cols
         conditions: List[str] = []
         params: List[Any] = []
 
@@ -539,41 +753,15 @@ class SqlRelationalDataProvider(RelationalDataProvider):
         if score_params:
             params.extend(score_params)
 
-        order_clause = f"ORDER BY {semantic_order}" if semantic_order else ""
-
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-        group_clause = f"GROUP BY {', '.join(group_cols)}" if group_cols else ""
-        limit_clause = f"LIMIT {req.limit}" if req.limit is not None else ""
-        offset_clause = f"OFFSET {req.offset}" if req.offset else ""
-
-        root_alias = self._lookup_alias(req.root_entity, index)
-        sql_parts = [
-            "SELECT",
-            ", ".join(select_parts),
-            "FROM",
-            f"{self._quote_table(self._table_name(req.root_entity))} AS {self._quote_ident(root_alias)}",
-        ]
-        if joins:
-            sql_parts.append(" ".join(joins))
-        if where_clause:
-            sql_parts.append(where_clause)
-        if group_clause:
-            sql_parts.append(group_clause)
-        if order_clause:
-            sql_parts.append(order_clause)
-        if limit_clause:
-            sql_parts.append(limit_clause)
-        if offset_clause:
-            sql_parts.append(offset_clause)
-
-        sql = " ".join(part for part in sql_parts if part)
+        sql = self._assemble_sql(plan, req, conditions, semantic_order)
         cursor = self.connection.cursor()
         cursor.execute(sql, params)
 
         if group_cols:
-            columns = [desc[0] for desc in cursor.description]
+            positions = tuple(enumerate(desc[0] for desc in cursor.description))
             rows = [
-                RowResult(entity=req.root_entity, data=dict(zip(columns, row))) for row in cursor.fetchall()
+                RowResult(entity=req.root_entity, data={col: row[idx] for idx, col in positions})
+                for row in self._iter_cursor_rows(cursor)
             ]
             return QueryResult(rows=rows, meta={"group_by": group_cols, "relations_used": req.relations})
 
@@ -584,31 +772,44 @@ class SqlRelationalDataProvider(RelationalDataProvider):
                 agg_results[col[0]] = AggregationResult(key=col[0], value=row[idx])
         return QueryResult(aggregations=agg_results, meta={"relations_used": req.relations})
 
-    def _row_from_db(
+    def _iter_cursor_rows(self, cursor) -> Iterator[Sequence[Any]]:
+        """Yield result rows in ``fetchmany`` chunks instead of one ``fetchall`` list."""
+        while True:
+            chunk = cursor.fetchmany(_FETCH_BATCH_SIZE)
+            if not chunk:
+                return
+            yield from chunk
+
+    def _row_plan(
         self,
-        row: Sequence[Any],
         columns: Sequence[str],
         base_columns: List[str],
-        root_entity: str,
         related_fields: Optional[Dict[str, Tuple[str, str]]] = None,
-    ) -> RowResult:
-        data_map = dict(zip(columns, row))
-        data = {col: data_map[col] for col in base_columns if col in data_map}
-        related: Dict[str, Dict[str, Any]] = {}
-        for col_name, value in data_map.items():
-            if col_name in base_columns:
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, str, int]]]:
+        """Map result columns to row positions once per query.
+
+        Returns ``(data_plan, related_plan)``: ``(column, index)`` pairs for the
+        root entity's data and ``(entity, field, index)`` triples for related
+        entities. Columns prefixed with ``__`` or without an ``entity__field``
+        shape are dropped. When a column name repeats, its last value wins.
+        """
+        positions = {col: idx for idx, col in enumerate(columns)}
+        base_set = set(base_columns)
+        data_plan = [(col, positions[col]) for col in dict.fromkeys(base_columns) if col in positions]
+        related_plan: List[Tuple[str, str, int]] = []
+        for col_name, idx in positions.items():
+            if col_name in base_set:
                 continue
             if related_fields and col_name in related_fields:
                 ent, fld = related_fields[col_name]
-                related.setdefault(ent, {})[fld] = value
+                related_plan.append((ent, fld, idx))
                 continue
             if col_name.startswith("__"):
                 continue
-            if "__" in col_name:
-                ent, fld = col_name.split("__", 1)
-                if ent:
-                    related.setdefault(ent, {})[fld] = value
-        return RowResult(entity=root_entity, data=data, related=related)
+            ent, sep, fld = col_name.partition("__")
+            if sep and ent:
+                related_plan.append((ent, fld, idx))
+        return data_plan, related_plan
 
     def _handle_semantic_only(self, req) -> SemanticOnlyResult:
         if not self.semantic_backend:
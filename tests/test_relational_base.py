@@ -16,3 +16,16 @@ def test_normalize_string_internal_whitespace():
 def test_normalize_string_non_string_values():
     assert RelationalDataProvider._normalize_string(123) == "123"
     assert RelationalDataProvider._normalize_string(None) == "none"
+
+
+def test_serialize_query_result_trims_rows():
+    from fetchgraph.relational.models import QueryResult, RowResult
+
+    provider = RelationalDataProvider("rel", [], [])
+    row = RowResult(entity="order", data={"id": 1, "status": "new"}, related={"customer": {"id": 10, "name": "Acme"}})
+    text = provider.serialize(QueryResult(rows=[row] * 12))
+
+    lines = text.splitlines()
+    assert lines[0] == "id=1 | status=new | customer=id:10,name:Acme"
+    assert len(lines) == 11
+    assert lines[-1] == "... trimmed 2 rows ..."
@@ -151,3 +151,42 @@ def test_composite_handles_relation_alias_in_filters():
     result = composite.fetch("demo", selectors=query.model_dump())
 
     assert result.meta["provider"] == "orders_rel"
+
+
+def test_composite_routes_parsed_query_without_revalidation(monkeypatch):
+    products = _products_provider()
+    composite = CompositeRelationalProvider("composite", {"products": products})
+    query = RelationalQuery(root_entity="product", select=[SelectExpr(expr="sku")])
+
+    calls = []
+    original = RelationalQuery.model_validate
+
+    def counting_validate(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(RelationalQuery, "model_validate", counting_validate)
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert len(calls) == 1
+    assert result.meta["child_provider"] == "products"
+    assert [row.data["sku"] for row in result.rows] == ["ABC-1"]
+
+
+def test_composite_reuses_routing_for_queries_differing_in_values():
+    products = _products_provider()
+    composite = CompositeRelationalProvider("composite", {"products": products})
+
+    for sku, limit in (("ABC-1", 1), ("XYZ-2", 5), ("QRS-3", None)):
+        query = RelationalQuery(
+            root_entity="product",
+            filters=ComparisonFilter(entity="product", field="sku", op="=", value=sku),
+            limit=limit,
+        )
+        result = composite.fetch("demo", selectors=query.model_dump())
+        assert result.meta["child_provider"] == "products"
+
+    info = composite._route_for.cache_info()
+    assert info.currsize == 1
+    assert composite._route_for(frozenset({"product"}), frozenset()) == ("products", products)
+    assert info.hits == 2
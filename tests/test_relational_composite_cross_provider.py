@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sqlite3
+import threading
 from typing import Literal, cast
 
 import pytest
@@ -13,14 +15,34 @@ from fetchgraph.relational import (
     CompositeRelationalProvider,
     EntityDescriptor,
     GroupBySpec,
+    LogicalFilter,
     PandasRelationalDataProvider,
     RelationalQuery,
     RelationDescriptor,
     RelationJoin,
     SelectExpr,
+    SqlRelationalDataProvider,
 )
 
 
+def _record_fetches(monkeypatch, provider, threads: list | None = None) -> list:
+    """Record the selectors of every ``provider.fetch`` call.
+
+    When ``threads`` is given, the name of the calling thread is appended too.
+    """
+    calls: list = []
+    original_fetch = provider.fetch
+
+    def recording_fetch(feature_name, selectors=None, **kwargs):
+        calls.append(selectors)
+        if threads is not None:
+            threads.append(threading.current_thread().name)
+        return original_fetch(feature_name, selectors=selectors, **kwargs)
+
+    monkeypatch.setattr(provider, "fetch", recording_fetch)
+    return calls
+
+
 def _build_block_system_composite(
     *,
     join_type: Literal["inner", "left", "right", "outer"] = "inner",
@@ -57,6 +79,7 @@ def _build_block_system_composite(
             ColumnDescriptor(name="id", role="primary_key"),
             ColumnDescriptor(name="block_id", role="foreign_key"),
             ColumnDescriptor(name="code"),
+            ColumnDescriptor(name="cost"),
         ],
     )
     relation = RelationDescriptor(
@@ -188,6 +211,29 @@ def test_cross_join_many_to_1():
     assert related_titles == ["Eng", "Eng", "HR"]
 
 
+def test_cross_join_fetches_remote_chunks_concurrently(monkeypatch):
+    composite = _build_employee_department_composite(
+        max_right_rows_per_batch=1, max_remote_workers=4
+    )
+    threads: list = []
+    _record_fetches(monkeypatch, composite.children["departments"], threads)
+    query = RelationalQuery(root_entity="employee", relations=["employee_department"])
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    related_titles = [row.related["department"]["title"] for row in result.rows]
+    assert related_titles == ["Eng", "Eng", "HR"]
+    assert len(threads) == 2
+    assert all(name.startswith("composite-remote") for name in threads)
+
+    composite.close()
+    threads.clear()
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert [row.related["department"]["title"] for row in result.rows] == ["Eng", "Eng", "HR"]
+    assert threads == [threading.current_thread().name] * 2
+
+
 def test_cross_join_1_to_1():
     composite = _build_one_to_one_composite()
     query = RelationalQuery(root_entity="left", relations=["left_right"])
@@ -241,6 +287,20 @@ def test_cross_join_respects_max_join_rows_per_batch():
     assert len(result.rows) == 3
 
 
+def test_cross_join_coalesces_right_fetches_across_left_batches(monkeypatch):
+    composite = _build_block_system_composite(
+        max_join_rows_per_batch=1, right_coalesce_batches=3
+    )
+    calls = _record_fetches(monkeypatch, composite.children["systems"])
+    query = RelationalQuery(root_entity="block", relations=["block_system"])
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    pairs = [(row.data["id"], row.related["system"]["code"]) for row in result.rows]
+    assert pairs == [(1, "S1"), (1, "S2"), (2, "S3")]
+    assert len(calls) == 1
+
+
 def test_cross_join_handles_right_batch_overflow_for_1_to_many():
     system_df = pd.DataFrame(
         {"id": [10, 11, 12], "block_id": [1, 1, 1], "code": ["S1", "S2", "S3"]}
@@ -301,6 +361,32 @@ def test_cross_provider_global_aggregation_count_remote():
     assert result.aggregations["total_systems"].value == 3
 
 
+def test_cross_provider_aggregations_merge_across_batches():
+    composite = _build_block_system_composite(join_type="left", max_join_rows_per_batch=1)
+    query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        group_by=[GroupBySpec(field="group")],
+        aggregations=[
+            AggregationSpec(field="system.id", agg="sum", alias="id_sum"),
+            AggregationSpec(field="system.id", agg="min", alias="id_min"),
+            AggregationSpec(field="system.id", agg="max", alias="id_max"),
+            AggregationSpec(field="system.id", agg="avg", alias="id_avg"),
+            AggregationSpec(field="system.code", agg="count_distinct", alias="codes"),
+        ],
+    )
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    grouped = {row.data["group"]: row.data for row in result.rows}
+    assert grouped["g1"]["id_sum"] == 21
+    assert (grouped["g1"]["id_min"], grouped["g1"]["id_max"]) == (10, 11)
+    assert grouped["g1"]["id_avg"] == 10.5
+    assert grouped["g1"]["codes"] == 2
+    assert grouped["g2"]["id_sum"] == 12
+    assert grouped["g2"]["codes"] == 1
+
+
 def test_cross_provider_groupby_default_count():
     composite = _build_block_system_composite(join_type="left")
     query = RelationalQuery(
@@ -329,12 +415,128 @@ def test_cross_provider_groupby_remote_field():
     assert grouped == {"S1": 1, "S2": 1, "S3": 1, None: 1}
 
 
-def test_cross_provider_filter_on_remote_entity_raises():
+def test_cross_provider_filter_on_remote_entity_raises_for_left_join():
+    composite = _build_block_system_composite(join_type="left")
+    query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        filters=ComparisonFilter(entity="system", field="code", op="=", value="S1"),
+    )
+
+    with pytest.raises(NotImplementedError, match="Filters on non-root providers are not supported"):
+        composite.fetch("demo", selectors=query.model_dump())
+
+
+def test_cross_provider_inner_join_pushes_remote_filter_down(monkeypatch):
     composite = _build_block_system_composite(join_type="inner")
+    calls = _record_fetches(monkeypatch, composite.children["systems"])
+    query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        filters=LogicalFilter(
+            op="and",
+            clauses=[
+                ComparisonFilter(field="group", op="=", value="g1"),
+                ComparisonFilter(entity="system", field="code", op="in", value=["S1", "S3"]),
+            ],
+        ),
+    )
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    pairs = [(row.data["id"], row.related["system"]["code"]) for row in result.rows]
+    assert pairs == [(1, "S1")]
+    assert len(calls) == 1
+    remote_filter = calls[0]["filters"]
+    assert remote_filter["op"] == "and"
+    assert {"entity": "system", "field": "code", "op": "in", "value": ["S1", "S3"], "type": "comparison"} in remote_filter["clauses"]
+
+
+def test_cross_provider_pushed_down_filter_keeps_case_sensitivity(monkeypatch):
+    system_df = pd.DataFrame(
+        {"id": [10, 11, 12], "block_id": [1, 1, 1], "code": ["S1", "s1", "S1"]}
+    )
+    # A one-row budget sends the remote side through the count query and the
+    # paged per-key fetch as well as the chunk fetch.
+    composite = _build_block_system_composite(
+        join_type="inner", system_df=system_df, max_right_rows_per_batch=1
+    )
+    calls = _record_fetches(monkeypatch, composite.children["systems"])
     query = RelationalQuery(
         root_entity="block",
         relations=["block_system"],
         filters=ComparisonFilter(entity="system", field="code", op="=", value="S1"),
+        case_sensitivity=True,
+    )
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert sorted(row.related["system"]["id"] for row in result.rows) == [10, 12]
+    assert len(calls) > 2
+    assert all(call["case_sensitivity"] is True for call in calls)
+
+
+def test_cross_provider_join_requests_only_needed_remote_columns(monkeypatch):
+    composite = _build_block_system_composite(join_type="inner")
+    calls = _record_fetches(monkeypatch, composite.children["systems"])
+    query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        select=[SelectExpr(expr="name"), SelectExpr(expr="system.code")],
+    )
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert [(row.data["name"], row.related["system"]["code"]) for row in result.rows] == [
+        ("A", "S1"),
+        ("A", "S2"),
+        ("B", "S3"),
+    ]
+    assert [sel["expr"] for sel in calls[0]["select"]] == ["block_id", "id", "code"]
+
+
+def test_cross_provider_projected_remote_values_are_python_scalars():
+    # Only numeric remote columns are requested, so the pandas child projects
+    # an all-numeric frame.
+    system_df = pd.DataFrame({"id": [10, 11, 12], "block_id": [1, 1, 2], "cost": [5, 7, 3]})
+    composite = _build_block_system_composite(join_type="inner", system_df=system_df)
+
+    select_query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        select=[SelectExpr(expr="name"), SelectExpr(expr="system.cost")],
+    )
+    selected = composite.fetch("demo", selectors=select_query.model_dump())
+
+    assert [row.related["system"]["cost"] for row in selected.rows] == [5, 7, 3]
+    assert all(type(row.related["system"]["cost"]) is int for row in selected.rows)
+    selected.model_dump_json()
+
+    agg_query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        aggregations=[AggregationSpec(field="system.cost", agg="sum", alias="total_cost")],
+    )
+    aggregated = composite.fetch("demo", selectors=agg_query.model_dump())
+
+    total = aggregated.aggregations["total_cost"].value
+    assert total == 15
+    assert type(total) is int
+    aggregated.model_dump_json()
+
+
+def test_cross_provider_filter_mixing_root_and_remote_in_or_raises():
+    composite = _build_block_system_composite(join_type="inner")
+    query = RelationalQuery(
+        root_entity="block",
+        relations=["block_system"],
+        filters=LogicalFilter(
+            op="or",
+            clauses=[
+                ComparisonFilter(field="group", op="=", value="g1"),
+                ComparisonFilter(entity="system", field="code", op="=", value="S3"),
+            ],
+        ),
     )
 
     with pytest.raises(NotImplementedError, match="Filters on non-root providers are not supported"):
@@ -395,3 +597,164 @@ def test_single_provider_routing_simple_query():
     assert [(row.data, row.related) for row in result.rows] == [
         (row.data, row.related) for row in expected.rows
     ]
+
+
+def test_cross_join_prefetches_next_left_batch(monkeypatch):
+    composite = _build_employee_department_composite(
+        max_join_rows_per_batch=1, prefetch_local_batches=True
+    )
+    threads: list = []
+    _record_fetches(monkeypatch, composite.children["employees"], threads)
+    query = RelationalQuery(root_entity="employee", relations=["employee_department"])
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    related_titles = [row.related["department"]["title"] for row in result.rows]
+    assert related_titles == ["Eng", "Eng", "HR"]
+    # The first page is fetched inline; every later one on the prefetch thread.
+    assert threads[0] == threading.current_thread().name
+    assert len(threads) > 1
+    assert all(name.startswith("composite-local") for name in threads[1:])
+
+    limited = composite.fetch(
+        "demo", selectors={**query.model_dump(), "limit": 2}
+    )
+    assert [row.data["id"] for row in limited.rows] == [1, 2]
+
+    composite.close()
+    threads.clear()
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert [row.related["department"]["title"] for row in result.rows] == ["Eng", "Eng", "HR"]
+    assert set(threads) == {threading.current_thread().name}
+
+
+def test_cross_left_join_to_one_stops_paging_once_limit_is_covered(monkeypatch):
+    composite = _build_block_system_composite(
+        join_type="left",
+        cardinality="1_to_1",
+        system_df=pd.DataFrame({"id": [10, 11], "block_id": [1, 2], "code": ["S1", "S2"]}),
+        max_join_rows_per_batch=2,
+        prefetch_local_batches=True,
+    )
+    calls = _record_fetches(monkeypatch, composite.children["blocks"])
+    query = RelationalQuery(root_entity="block", relations=["block_system"], limit=2)
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    pairs = [(row.data["id"], row.related["system"]["code"]) for row in result.rows]
+    assert pairs == [(1, "S1"), (2, "S2")]
+    assert len(calls) == 1
+
+
+def test_cross_left_join_to_one_counts_coalesced_rows_towards_limit(monkeypatch):
+    composite = _build_block_system_composite(
+        join_type="left",
+        cardinality="1_to_1",
+        system_df=pd.DataFrame({"id": [10, 11], "block_id": [1, 2], "code": ["S1", "S2"]}),
+        max_join_rows_per_batch=1,
+        right_coalesce_batches=3,
+    )
+    calls = _record_fetches(monkeypatch, composite.children["blocks"])
+    query = RelationalQuery(root_entity="block", relations=["block_system"], limit=2)
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    pairs = [(row.data["id"], row.related["system"]["code"]) for row in result.rows]
+    assert pairs == [(1, "S1"), (2, "S2")]
+    assert len(calls) == 2
+
+
+def test_cross_provider_plan_is_reused_for_repeated_relation_chains(monkeypatch):
+    composite = _build_employee_department_composite()
+    calls = []
+    original = composite._root_provider_for_impl
+
+    def counting_root_provider_for(*args):
+        calls.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(composite, "_root_provider_for_impl", counting_root_provider_for)
+    for name in ("A", "B"):
+        query = RelationalQuery(
+            root_entity="employee",
+            relations=["employee_department"],
+            filters=ComparisonFilter(field="name", op="=", value=name),
+        )
+        result = composite.fetch("demo", selectors=query.model_dump())
+        assert [row.data["name"] for row in result.rows] == [name]
+
+    assert len(calls) == 1
+
+
+def test_cross_join_single_string_key_matches_sql_remote_exactly(monkeypatch):
+    conn = sqlite3.connect(":memory:")
+    conn.execute('CREATE TABLE "department" ("code" TEXT PRIMARY KEY, "title" TEXT)')
+    # "ENG-10" comes first and has "ENG-1" as a prefix: a relaxed string
+    # equality on the remote side would pick it instead of the real match.
+    conn.executemany(
+        'INSERT INTO "department" (code, title) VALUES (?, ?)',
+        [("ENG-10", "Platform"), ("ENG-1", "Eng")],
+    )
+    conn.commit()
+    department = EntityDescriptor(
+        name="department",
+        columns=[
+            ColumnDescriptor(name="code", role="primary_key"),
+            ColumnDescriptor(name="title"),
+        ],
+    )
+    employee = EntityDescriptor(
+        name="employee",
+        columns=[
+            ColumnDescriptor(name="id", role="primary_key"),
+            ColumnDescriptor(name="department_code", role="foreign_key"),
+        ],
+    )
+    relation = RelationDescriptor(
+        name="employee_department",
+        from_entity="employee",
+        to_entity="department",
+        cardinality="many_to_1",
+        join=RelationJoin(
+            from_entity="employee",
+            from_column="department_code",
+            to_entity="department",
+            to_column="code",
+            join_type="left",
+        ),
+    )
+    employees = PandasRelationalDataProvider(
+        "employee_rel",
+        [employee],
+        [relation],
+        {"employee": pd.DataFrame({"id": [1], "department_code": ["ENG-1"]})},
+    )
+    departments = SqlRelationalDataProvider(
+        name="department_rel_sql", entities=[department], relations=[], connection=conn
+    )
+    composite = CompositeRelationalProvider(
+        "composite", {"employees": employees, "departments": departments}
+    )
+    calls = _record_fetches(monkeypatch, departments)
+    query = RelationalQuery(root_entity="employee", relations=["employee_department"], limit=1)
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    assert [row.related["department"] for row in result.rows] == [
+        {"code": "ENG-1", "title": "Eng"}
+    ]
+    assert calls[0]["filters"]["op"] == "in"
+
+
+def test_cross_join_groups_interleaved_remote_rows():
+    system_df = pd.DataFrame(
+        {"id": [10, 11, 12], "block_id": [1, 2, 1], "code": ["S1", "S3", "S2"]}
+    )
+    composite = _build_block_system_composite(system_df=system_df)
+    query = RelationalQuery(root_entity="block", relations=["block_system"])
+
+    result = composite.fetch("demo", selectors=query.model_dump())
+
+    pairs = [(row.data["id"], row.related["system"]["code"]) for row in result.rows]
+    assert pairs == [(1, "S1"), (1, "S2"), (2, "S3")]
@@ -420,6 +420,28 @@ def test_filters_with_logical_clause():
     assert ids == [103]
 
 
+def test_query_plan_is_reused_across_filter_values(monkeypatch):
+    provider = _make_provider()
+    calls = []
+    original = provider._build_relations
+
+    def counting_build_relations(req):
+        calls.append(req)
+        return original(req)
+
+    monkeypatch.setattr(provider, "_build_relations", counting_build_relations)
+    for total in (150, 250):
+        req = RelationalQuery(
+            root_entity="order",
+            relations=["order_customer"],
+            filters=ComparisonFilter(entity="order", field="total", op=">", value=total),
+        )
+        res = provider.fetch("demo", selectors=req.model_dump())
+        assert all(row.data["total"] > total for row in res.rows)
+
+    assert len(calls) == 1
+
+
 def test_in_filter_requires_sequence_value():
     provider = _make_provider()
     req = RelationalQuery(
@@ -466,6 +488,29 @@ def test_semantic_filter_respects_threshold():
     assert [row.data["customer_id"] for row in res.rows] == [1, 1]
 
 
+def test_semantic_filter_uses_values_table_above_threshold():
+    backend = FakeSemanticBackend(
+        [
+            SemanticMatch(entity="customer", id=1, score=0.9),
+            SemanticMatch(entity="customer", id=3, score=0.5),
+        ]
+    )
+    provider = _make_provider(semantic_backend=backend)
+    provider.values_in_threshold = 1
+    req = RelationalQuery(
+        root_entity="order",
+        relations=["order_customer"],
+        semantic_clauses=[
+            SemanticClause(entity="customer", fields=["notes"], query="pharma", mode="filter"),
+        ],
+    )
+    cond = provider._id_list_condition('"t1"."id"', 2)
+    res = provider.fetch("demo", selectors=req.model_dump())
+
+    assert cond == '"t1"."id" IN (SELECT column1 FROM (VALUES (?),(?)))'
+    assert sorted(row.data["customer_id"] for row in res.rows) == [1, 1]
+
+
 def test_semantic_boost_sorts_by_score_and_threshold():
     backend = FakeSemanticBackend(
         [